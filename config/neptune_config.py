@@ -3,16 +3,57 @@ Configuration for Neptune Analytics integration.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+@dataclass(frozen=True)
+class NeptuneConfig:
+    """
+    Neptune Analytics connection settings read from the environment.
+    """
+    endpoint: Optional[str]
+    port: str
+    auth_mode: str  # 'IAM' or 'DEFAULT'
+    region: str
 
-# Neptune Analytics configuration
-NEPTUNE_ENDPOINT = os.getenv('NEPTUNE_ENDPOINT')
-NEPTUNE_PORT = os.getenv('NEPTUNE_PORT', '8182')
-NEPTUNE_AUTH_MODE = os.getenv('NEPTUNE_AUTH_MODE', 'IAM')  # 'IAM' or 'DEFAULT'
-NEPTUNE_REGION = os.getenv('NEPTUNE_REGION', 'us-west-2')
+@lru_cache(maxsize=1)
+def get_config() -> NeptuneConfig:
+    """
+    Returns the Neptune configuration, reading .env and the environment on first use.
+    
+    Call get_config.cache_clear() to pick up environment changes.
+    
+    Returns:
+        NeptuneConfig: Neptune connection settings
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+    
+    return NeptuneConfig(
+        endpoint=os.getenv('NEPTUNE_ENDPOINT'),
+        port=os.getenv('NEPTUNE_PORT', '8182'),
+        auth_mode=os.getenv('NEPTUNE_AUTH_MODE', 'IAM'),
+        region=os.getenv('NEPTUNE_REGION', 'us-west-2')
+    )
+
+# Module attributes served from get_config(), for existing importers
+_CONFIG_ATTRIBUTES = {
+    'NEPTUNE_ENDPOINT': 'endpoint',
+    'NEPTUNE_PORT': 'port',
+    'NEPTUNE_AUTH_MODE': 'auth_mode',
+    'NEPTUNE_REGION': 'region'
+}
+
+def __getattr__(name):
+    """
+    Serves the NEPTUNE_* settings as module attributes from get_config().
+    """
+    field = _CONFIG_ATTRIBUTES.get(name)
+    if field is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(get_config(), field)
 
 # Vector configuration
 VECTOR_DIMENSION = 1024  # Common embedding size
@@ -39,13 +80,56 @@ def get_neptune_connection_string():
     Returns:
         str: Neptune connection string
     """
-    if not NEPTUNE_ENDPOINT:
+    config = get_config()
+    if not config.endpoint:
         raise ValueError("NEPTUNE_ENDPOINT environment variable is not set")
-        
-    if NEPTUNE_AUTH_MODE.upper() == 'IAM':
-        return f"wss://{NEPTUNE_ENDPOINT}:{NEPTUNE_PORT}/gremlin"
+    
+    if config.auth_mode.upper() == 'IAM':
+        return f"wss://{config.endpoint}:{config.port}/gremlin"
     else:
-        return f"ws://{NEPTUNE_ENDPOINT}:{NEPTUNE_PORT}/gremlin"
+        return f"ws://{config.endpoint}:{config.port}/gremlin"
+
+@lru_cache(maxsize=4)
+def get_boto3_session(region: str):
+    """
+    Returns the boto3 session shared by Neptune clients in a region.
+    
+    Args:
+        region (str): AWS region
+    
+    Returns:
+        boto3.Session: The shared session
+    """
+    import boto3
+    return boto3.Session(region_name=region)
+
+def get_signed_request_headers(url: str) -> Dict[str, str]:
+    """
+    Returns SigV4 headers authenticating a Neptune WebSocket request under IAM.
+    
+    Credentials come from the shared session, so they are resolved once and
+    refreshed by botocore rather than re-read for every connection. The
+    signature expires within minutes, so sign each handshake when it is made.
+    
+    Args:
+        url (str): The Neptune connection string
+    
+    Returns:
+        Dict[str, str]: Headers to send with the WebSocket handshake
+    """
+    from botocore.auth import SigV4Auth
+    from botocore.awsrequest import AWSRequest
+    
+    region = get_config().region
+    credentials = get_boto3_session(region).get_credentials()
+    if credentials is None:
+        raise ValueError("No AWS credentials available for Neptune IAM authentication")
+    
+    # SigV4 signs the HTTP form of the WebSocket URL
+    http_url = url.replace('wss://', 'https://', 1).replace('ws://', 'http://', 1)
+    request = AWSRequest(method='GET', url=http_url)
+    SigV4Auth(credentials.get_frozen_credentials(), 'neptune-db', region).add_auth(request)
+    return dict(request.headers.items())
 
 # HyperIBIS specific constants
 ISSUE_TYPES = {
@@ -0,0 +1,74 @@
+"""
+Shared on-disk cache for Bedrock embedding results used by the test scripts.
+
+Embeddings are deterministic for a given model and input, so repeated test
+runs can reuse earlier results instead of re-invoking Bedrock.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Cache location, overridable for CI runners with a different cache root
+CACHE_DIR = Path(os.environ.get("CWEB_EMBED_CACHE_DIR", "~/.cache/cweb/embeddings")).expanduser()
+
+def _cache_path(text, model_id):
+    """
+    Get the cache file for a text embedded with a model.
+
+    Args:
+        text (str): The embedded text
+        model_id (str): The Bedrock model ID
+
+    Returns:
+        Path: The cache file path
+    """
+    key = hashlib.sha256(f"{model_id}\0{text}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+def cached_embed(text, model_id, embed_fn, use_cache=True):
+    """
+    Get an embedding, reading and populating the disk cache.
+
+    Args:
+        text (str): The text to embed
+        model_id (str): The Bedrock model ID, part of the cache key
+        embed_fn (callable): Function embedding a single text on a cache miss
+        use_cache (bool, optional): Set to False to bypass the cache entirely
+
+    Returns:
+        list: The embedding
+    """
+    if not use_cache:
+        return embed_fn(text)
+
+    path = _cache_path(text, model_id)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            embedding = json.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        # A corrupt or truncated entry is recomputed and overwritten below
+        logger.warning(f"Ignoring unreadable embedding cache entry {path}: {e}")
+    else:
+        logger.info(f"Using cached {model_id} embedding")
+        return embedding
+
+    embedding = embed_fn(text)
+
+    # Write atomically so concurrent runs never read a partial entry
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(embedding, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write embedding cache: {e}")
+
+    return embedding
@@ -7,10 +7,23 @@ import os
 import sys
 import json
 import boto3
+import functools
 import argparse
 import logging
+from botocore.config import Config
 from dotenv import load_dotenv
 
+from _embed_cache import cached_embed
+
+# Prefer orjson for encoding Bedrock requests and decoding responses
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
@@ -21,10 +34,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of texts Cohere embed models accept in one request
+COHERE_MAX_BATCH_SIZE = 96
+
+@functools.lru_cache(maxsize=1)
 def get_neptune_analytics_endpoint():
     """
     Get the Neptune Analytics endpoint from the graph ID.
     
+    The endpoint is resolved once per process; a missing graph ID raises
+    every time since exceptions are not cached.
+    
     Returns:
         str: The Neptune Analytics endpoint
     """
@@ -35,15 +55,31 @@ def get_neptune_analytics_endpoint():
     region = os.environ.get("NEPTUNE_ANALYTICS_REGION", "us-west-2")
     return f"{graph_id}.{region}.neptune-graph.amazonaws.com"
 
-def get_bedrock_client():
+@functools.lru_cache(maxsize=4)
+def get_bedrock_client(region=None):
     """
-    Get a Bedrock client.
+    Get the shared Bedrock client for a region.
+    
+    One client is created per region per process so that every embedding
+    call reuses the same connection pool instead of re-handshaking.
     
+    Args:
+        region (str, optional): The AWS region, defaults to AWS_REGION
+        
     Returns:
         boto3.client: The Bedrock client
     """
-    region = os.environ.get("AWS_REGION", "us-west-2")
-    return boto3.client("bedrock-runtime", region_name=region)
+    if region is None:
+        region = os.environ.get("AWS_REGION", "us-west-2")
+    config = Config(
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        retries={
+            'max_attempts': 5,
+            'mode': 'adaptive'
+        }
+    )
+    return boto3.client("bedrock-runtime", region_name=region, config=config)
 
 def get_cohere_embeddings(text, client=None):
     """
@@ -56,37 +92,55 @@ def get_cohere_embeddings(text, client=None):
     Returns:
         list: The embeddings
     """
+    return get_cohere_embeddings_batch([text], client)[0]
+
+def get_cohere_embeddings_batch(texts, client=None, batch_size=COHERE_MAX_BATCH_SIZE):
+    """
+    Get Cohere embeddings for several texts, batching them into as few
+    Bedrock requests as the model allows.
+    
+    Args:
+        texts (list): The texts to embed
+        client (boto3.client, optional): The Bedrock client
+        batch_size (int, optional): Maximum number of texts per request
+        
+    Returns:
+        list: One embedding per input text, in input order
+    """
     if client is None:
         client = get_bedrock_client()
     
-    # Prepare request body
-    request_body = {
-        "texts": [text],
-        "input_type": "search_document",
-        "truncate": "NONE"
-    }
-    
-    # Invoke Bedrock
-    response = client.invoke_model(
-        modelId="cohere.embed-english-v3",
-        contentType="application/json",
-        accept="application/json",
-        body=json.dumps(request_body)
-    )
-    
-    # Parse response
-    response_body = json.loads(response["body"].read())
-    embeddings = response_body.get("embeddings", [])[0]
+    embeddings = []
+    for start in range(0, len(texts), batch_size):
+        # Prepare request body
+        request_body = {
+            "texts": texts[start:start + batch_size],
+            "input_type": "search_document",
+            "truncate": "NONE"
+        }
+        
+        # Invoke Bedrock
+        response = client.invoke_model(
+            modelId="cohere.embed-english-v3",
+            contentType="application/json",
+            accept="application/json",
+            body=_json_dumps(request_body)
+        )
+        
+        # Parse response
+        response_body = _json_loads(response["body"].read())
+        embeddings.extend(response_body.get("embeddings", []))
     
     return embeddings
 
-def test_bedrock_embeddings(text, verbose=False):
+def test_bedrock_embeddings(text, verbose=False, use_cache=True):
     """
     Test Bedrock embeddings with Neptune Analytics.
     
     Args:
         text (str): The text to embed
         verbose (bool, optional): Enable verbose output
+        use_cache (bool, optional): Reuse embeddings cached by earlier runs
         
     Returns:
         bool: True if successful, False otherwise
@@ -98,7 +152,11 @@ def test_bedrock_embeddings(text, verbose=False):
         
         # Get Cohere embeddings
         logger.info("Getting Cohere embeddings...")
-        embeddings = get_cohere_embeddings(text, bedrock_client)
+        embeddings = cached_embed(
+            text, "cohere.embed-english-v3",
+            lambda t: get_cohere_embeddings(t, bedrock_client),
+            use_cache=use_cache
+        )
         
         if verbose:
             logger.info(f"Embeddings dimension: {len(embeddings)}")
@@ -127,10 +185,11 @@ def main():
     parser = argparse.ArgumentParser(description="Test Bedrock embeddings with Neptune Analytics")
     parser.add_argument("--text", "-t", default="This is a test text for Cohere embeddings.", help="Text to embed")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
+    parser.add_argument("--no-cache", action="store_true", help="Always call Bedrock instead of using cached embeddings")
     
     args = parser.parse_args()
     
-    if test_bedrock_embeddings(args.text, args.verbose):
+    if test_bedrock_embeddings(args.text, args.verbose, use_cache=not args.no_cache):
         logger.info("Test completed successfully")
         sys.exit(0)
     else:
@@ -6,6 +6,8 @@ Script to test connection to Neptune Analytics and perform basic operations.
 import os
 import sys
 import uuid
+import atexit
+import functools
 import numpy as np
 from dotenv import load_dotenv
 from gremlin_python.process.anonymous_traversal import traversal
@@ -21,11 +23,60 @@ load_dotenv()
 
 from config.neptune_config import get_neptune_connection_string, VECTOR_DIMENSION
 
+# Number of VectorVertex nodes created for the vector search test
+VECTOR_TEST_COUNT = 5
+
+# Seeded generator so test vectors are reproducible between runs
+_rng = np.random.default_rng(42)
+
+def random_vector():
+    """
+    Generate a random float32 test vector.
+    
+    Returns:
+        np.ndarray: A VECTOR_DIMENSION-long float32 array
+    """
+    return _rng.standard_normal(VECTOR_DIMENSION, dtype=np.float32)
+
+@functools.lru_cache(maxsize=1)
+def get_traversal():
+    """
+    Get the shared traversal source for Neptune Analytics.
+    
+    The underlying connection is opened once per process and closed at
+    interpreter exit, so repeated callers share one websocket pool.
+    
+    Returns:
+        GraphTraversalSource: Traversal source bound to the remote connection
+    """
+    connection = DriverRemoteConnection(
+        get_neptune_connection_string(), 'g', pool_size=8, max_workers=8
+    )
+    atexit.register(connection.close)
+    return traversal().withRemote(connection)
+
+def add_vector_vertices(g, rows, batch_size=500):
+    """
+    Insert VectorVertex nodes, chaining each batch into one traversal.
+    
+    Args:
+        g (GraphTraversalSource): The traversal source
+        rows (list): Dicts with 'id', 'name' and 'embedding' (np.ndarray) keys
+        batch_size (int, optional): Maximum vertices per submitted traversal
+    """
+    for start in range(0, len(rows), batch_size):
+        t = g
+        for row in rows[start:start + batch_size]:
+            # Convert to a list only at submission; Gremlin cannot serialize ndarrays
+            t = t.addV('VectorVertex').property(T.id, row['id']) \
+                .property('name', row['name']) \
+                .property('embedding', row['embedding'].tolist())
+        t.iterate()
+
 def test_neptune_connection():
     """Test connection to Neptune Analytics."""
     try:
-        connection = DriverRemoteConnection(get_neptune_connection_string(), 'g')
-        g = traversal().withRemote(connection)
+        g = get_traversal()
         
         print("✅ Successfully connected to Neptune Analytics")
         
@@ -44,20 +95,22 @@ def test_neptune_connection():
         
         # Test vector search capability
         print("\nTesting vector search capability...")
-        vector_test_id = f"vector-test-{uuid.uuid4()}"
+        vector_rows = [
+            {
+                'id': f"vector-test-{uuid.uuid4()}",
+                'name': f"Vector Test {i}",
+                'embedding': random_vector()
+            }
+            for i in range(VECTOR_TEST_COUNT)
+        ]
+        vector_test_ids = [row['id'] for row in vector_rows]
         
-        # Create a random vector
-        vector = np.random.rand(VECTOR_DIMENSION).tolist()
-        
-        # Create a vertex with a vector property
-        g.addV('VectorVertex').property(T.id, vector_test_id) \
-            .property('name', 'Vector Test') \
-            .property('embedding', vector) \
-            .next()
-        print(f"✅ Created vector test vertex with ID: {vector_test_id}")
+        # Create the vector vertices in a single round-trip
+        add_vector_vertices(g, vector_rows)
+        print(f"✅ Created {len(vector_test_ids)} vector test vertices")
         
         # Create a vector search query
-        query_vector = np.random.rand(VECTOR_DIMENSION).tolist()
+        query_vector = random_vector().tolist()
         
         try:
             # Attempt a vector search
@@ -75,13 +128,9 @@ def test_neptune_connection():
         
         # Clean up test vertices
         g.V(test_id).drop().iterate()
-        g.V(vector_test_id).drop().iterate()
+        g.V(*vector_test_ids).drop().iterate()
         print("✅ Cleaned up test vertices")
         
-        # Close the connection
-        connection.close()
-        print("✅ Connection closed")
-        
         return True
         
     except Exception as e:
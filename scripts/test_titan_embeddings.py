@@ -7,10 +7,22 @@ import os
 import sys
 import json
 import boto3
+import functools
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from dotenv import load_dotenv
 
+from _embed_cache import cached_embed
+
+# Prefer orjson for decoding Bedrock response bodies
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
@@ -35,15 +47,27 @@ def get_neptune_analytics_endpoint():
     region = os.environ.get("NEPTUNE_ANALYTICS_REGION", "us-west-2")
     return f"{graph_id}.{region}.neptune-graph.amazonaws.com"
 
+@functools.lru_cache(maxsize=1)
 def get_bedrock_client():
     """
-    Get a Bedrock client.
+    Get the shared Bedrock client.
+    
+    Throttling is handled by botocore's adaptive retry mode, which backs off
+    on ThrottlingException instead of sleeping between every request.
     
     Returns:
         boto3.client: The Bedrock client
     """
     region = os.environ.get("AWS_REGION", "us-west-2")
-    return boto3.client("bedrock-runtime", region_name=region)
+    config = Config(
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        retries={
+            'max_attempts': 8,
+            'mode': 'adaptive'
+        }
+    )
+    return boto3.client("bedrock-runtime", region_name=region, config=config)
 
 def get_titan_embeddings(text, client=None):
     """
@@ -73,18 +97,40 @@ def get_titan_embeddings(text, client=None):
     )
     
     # Parse response
-    response_body = json.loads(response["body"].read())
+    response_body = _json_loads(response["body"].read())
     embeddings = response_body.get("embedding")
     
     return embeddings
 
-def test_titan_embeddings(text, verbose=False):
+def get_titan_embeddings_batch(texts, client=None, max_workers=8):
+    """
+    Get Titan embeddings for several texts.
+    
+    Titan embedding models accept a single input text per request, so the
+    requests are issued concurrently over one shared client instead.
+    
+    Args:
+        texts (list): The texts to embed
+        client (boto3.client, optional): The Bedrock client
+        max_workers (int, optional): Maximum number of requests in flight
+        
+    Returns:
+        list: One embedding per input text, in input order
+    """
+    if client is None:
+        client = get_bedrock_client()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda text: get_titan_embeddings(text, client), texts))
+
+def test_titan_embeddings(text, verbose=False, use_cache=True):
     """
     Test Titan embeddings with Neptune Analytics.
     
     Args:
         text (str): The text to embed
         verbose (bool, optional): Enable verbose output
+        use_cache (bool, optional): Reuse embeddings cached by earlier runs
         
     Returns:
         bool: True if successful, False otherwise
@@ -96,7 +142,11 @@ def test_titan_embeddings(text, verbose=False):
         
         # Get Titan embeddings
         logger.info("Getting Titan embeddings...")
-        embeddings = get_titan_embeddings(text, bedrock_client)
+        embeddings = cached_embed(
+            text, "amazon.titan-embed-text-v1",
+            lambda t: get_titan_embeddings(t, bedrock_client),
+            use_cache=use_cache
+        )
         
         if verbose:
             logger.info(f"Embeddings dimension: {len(embeddings)}")
@@ -125,10 +175,11 @@ def main():
     parser = argparse.ArgumentParser(description="Test Titan embeddings with Neptune Analytics")
     parser.add_argument("--text", "-t", default="This is a test text for Titan embeddings.", help="Text to embed")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
+    parser.add_argument("--no-cache", action="store_true", help="Always call Bedrock instead of using cached embeddings")
     
     args = parser.parse_args()
     
-    if test_titan_embeddings(args.text, args.verbose):
+    if test_titan_embeddings(args.text, args.verbose, use_cache=not args.no_cache):
         logger.info("Test completed successfully")
         sys.exit(0)
     else:
@@ -5,9 +5,36 @@ Update Neptune configuration in project files.
 
 import os
 import sys
+import json
 import argparse
+import functools
+import re
 import logging
-from dotenv import load_dotenv
+from pathlib import Path
+from dotenv import load_dotenv, dotenv_values
+
+# Prefer orjson for reading and writing config.json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Project root, resolved once for all the files this script updates
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Sidecar recording the .env state left by the last successful update
+ENV_FINGERPRINT_FILE = PROJECT_ROOT / ".env.fingerprint"
+
+# NEPTUNE_ENDPOINT assignment line in src/config.py
+_CONFIG_ENDPOINT_RE = re.compile(r'^NEPTUNE_ENDPOINT\s*=.*$', re.MULTILINE)
+
+# Contents of a newly created .env, filled in from the current environment
+_DEFAULT_ENV = """\
+# Neptune Analytics Configuration
+NEPTUNE_ENDPOINT={endpoint}
+NEPTUNE_ANALYTICS_GRAPH_ID={graph_id}
+NEPTUNE_ANALYTICS_REGION={region}
+"""
 
 # Load environment variables
 load_dotenv()
@@ -19,9 +46,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
 def get_neptune_analytics_endpoint():
     """
-    Get the Neptune Analytics endpoint from the graph ID.
+    Get the Neptune Analytics endpoint from the graph ID, resolved once
+    per process.
     
     Returns:
         str: The Neptune Analytics endpoint
@@ -33,6 +62,172 @@ def get_neptune_analytics_endpoint():
     region = os.environ.get("NEPTUNE_ANALYTICS_REGION", "us-west-2")
     return f"{graph_id}.{region}.neptune-graph.amazonaws.com"
 
+def write_if_changed(path, content):
+    """
+    Write a file only if its contents would change.
+    
+    Skipping identical writes keeps the file's mtime stable, so nothing
+    watching it is triggered needlessly.
+    
+    Args:
+        path (Path): The file to write
+        content (str): The new contents
+        
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    
+    with open(path, "w") as f:
+        f.write(content)
+    return True
+
+def rewrite_env_lines(lines, updates):
+    """
+    Apply variable updates to the lines of a .env file.
+    
+    Each line is split once on '=' and its variable name looked up in a
+    replacement table, rather than tested against every variable prefix.
+    Variables that do not appear in the file are appended at the end.
+    
+    Args:
+        lines (list): The .env lines, with line endings
+        updates (dict): Mapping of variable name to new value
+        
+    Returns:
+        list: The updated lines
+    """
+    replacements = {key: f"{key}={value}\n" for key, value in updates.items()}
+    
+    out = []
+    seen = set()
+    for line in lines:
+        key = line.split("=", 1)[0].strip()
+        replacement = replacements.get(key)
+        if replacement is not None and "=" in line:
+            out.append(replacement)
+            seen.add(key)
+        else:
+            out.append(line)
+    
+    missing = [line for key, line in replacements.items() if key not in seen]
+    if missing and out and not out[-1].endswith("\n"):
+        out[-1] += "\n"
+    out.extend(missing)
+    
+    return out
+
+def write_frozen_env(env_file):
+    """
+    Write the .env values as a Python module of literals.
+    
+    Importing config/env_frozen.py is a bytecode-cache load, so the
+    GraphRAG integration uses it instead of parsing .env on every start.
+    
+    Args:
+        env_file (Path): The .env file to freeze
+    """
+    frozen_file = PROJECT_ROOT / "config" / "env_frozen.py"
+    values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    
+    out = [
+        '"""\n',
+        'Frozen copy of .env, generated by scripts/update_neptune_config.py.\n',
+        '"""\n',
+        '\n',
+        'ENV = {\n',
+    ]
+    out.extend(f"    {key!r}: {value!r},\n" for key, value in values.items())
+    out.append('}\n')
+    
+    if write_if_changed(frozen_file, "".join(out)):
+        logger.info(f"Wrote {frozen_file}")
+    elif frozen_file.stat().st_mtime_ns < env_file.stat().st_mtime_ns:
+        # Same values but an older mtime would make loaders treat it as stale
+        os.utime(frozen_file)
+
+def update_env_file(env_file, target_endpoint):
+    """
+    Set NEPTUNE_ENDPOINT in the .env file, creating the file if needed.
+    
+    Args:
+        env_file (Path): The .env file
+        target_endpoint (str): The Neptune Analytics endpoint
+    """
+    if env_file.exists():
+        logger.info(f"Updating {env_file}...")
+        
+        # Parse the file once, edit in memory and write the result back
+        # in a single call
+        with open(env_file, "r") as f:
+            lines = f.read().splitlines(keepends=True)
+        
+        lines = rewrite_env_lines(lines, {"NEPTUNE_ENDPOINT": target_endpoint})
+        
+        if write_if_changed(env_file, "".join(lines)):
+            logger.info(f"Updated {env_file}")
+        else:
+            logger.info(f"{env_file} is already up to date")
+    else:
+        logger.info(f"{env_file} does not exist, creating...")
+        
+        with open(env_file, "w") as f:
+            f.write(_DEFAULT_ENV.format(
+                endpoint=target_endpoint,
+                graph_id=os.environ["NEPTUNE_ANALYTICS_GRAPH_ID"],
+                region=os.environ.get("NEPTUNE_ANALYTICS_REGION", "us-west-2")
+            ))
+        
+        logger.info(f"Created {env_file}")
+
+def _env_fingerprint(env_file, target_endpoint):
+    """
+    Get the fingerprint identifying a .env state the script has handled.
+    
+    Args:
+        env_file (Path): The .env file
+        target_endpoint (str): The Neptune Analytics endpoint
+        
+    Returns:
+        dict: The file's mtime and size, and the endpoint it was updated to
+    """
+    st = env_file.stat()
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "endpoint": target_endpoint}
+
+def env_file_is_current(env_file, target_endpoint):
+    """
+    Check whether .env is unchanged since it was last updated to an endpoint.
+    
+    Args:
+        env_file (Path): The .env file
+        target_endpoint (str): The Neptune Analytics endpoint
+        
+    Returns:
+        bool: True if .env and its frozen copy need no update
+    """
+    try:
+        if not (PROJECT_ROOT / "config" / "env_frozen.py").exists():
+            return False
+        with open(ENV_FINGERPRINT_FILE, "r") as f:
+            return json.load(f) == _env_fingerprint(env_file, target_endpoint)
+    except (OSError, ValueError):
+        return False
+
+def save_env_fingerprint(env_file, target_endpoint):
+    """
+    Record the current .env state after updating it.
+    
+    Args:
+        env_file (Path): The .env file
+        target_endpoint (str): The Neptune Analytics endpoint
+    """
+    write_if_changed(ENV_FINGERPRINT_FILE, json.dumps(_env_fingerprint(env_file, target_endpoint)))
+
 def update_config_files(verbose=False):
     """
     Update Neptune configuration in project files.
@@ -50,73 +245,57 @@ def update_config_files(verbose=False):
         
         logger.info(f"Neptune Analytics endpoint: {target_endpoint}")
         
-        # Update .env file if it exists
-        env_file = os.path.join(os.path.dirname(__file__), "..", ".env")
-        if os.path.exists(env_file):
-            logger.info(f"Updating {env_file}...")
-            
-            with open(env_file, "r") as f:
-                lines = f.readlines()
-            
-            updated = False
-            with open(env_file, "w") as f:
-                for line in lines:
-                    if line.startswith("NEPTUNE_ENDPOINT="):
-                        f.write(f"NEPTUNE_ENDPOINT={target_endpoint}\n")
-                        updated = True
-                    else:
-                        f.write(line)
-                
-                if not updated:
-                    f.write(f"NEPTUNE_ENDPOINT={target_endpoint}\n")
-            
-            logger.info(f"Updated {env_file}")
+        # Update .env file unless it is unchanged since the last run
+        env_file = PROJECT_ROOT / ".env"
+        if env_file_is_current(env_file, target_endpoint):
+            logger.info(f"{env_file} is unchanged since the last update, skipping")
         else:
-            logger.info(f"{env_file} does not exist, creating...")
-            
-            with open(env_file, "w") as f:
-                f.write(f"NEPTUNE_ENDPOINT={target_endpoint}\n")
-            
-            logger.info(f"Created {env_file}")
+            update_env_file(env_file, target_endpoint)
+            write_frozen_env(env_file)
+            save_env_fingerprint(env_file, target_endpoint)
         
         # Update config.py if it exists
-        config_file = os.path.join(os.path.dirname(__file__), "..", "src", "config.py")
-        if os.path.exists(config_file):
+        config_file = PROJECT_ROOT / "src" / "config.py"
+        if config_file.exists():
             logger.info(f"Updating {config_file}...")
             
             with open(config_file, "r") as f:
-                lines = f.readlines()
+                content = f.read()
+            
+            # Replace the assignment in a single regex pass over the file
+            endpoint_line = f'NEPTUNE_ENDPOINT = "{target_endpoint}"'
+            content, count = _CONFIG_ENDPOINT_RE.subn(lambda m: endpoint_line, content)
             
-            updated = False
-            with open(config_file, "w") as f:
-                for line in lines:
-                    if "NEPTUNE_ENDPOINT" in line and "=" in line:
-                        f.write(f'NEPTUNE_ENDPOINT = "{target_endpoint}"\n')
-                        updated = True
-                    else:
-                        f.write(line)
-                
-                if not updated:
-                    f.write('\n# Neptune Analytics configuration\n')
-                    f.write(f'NEPTUNE_ENDPOINT = "{target_endpoint}"\n')
+            if not count:
+                if content and not content.endswith("\n"):
+                    content += "\n"
+                content += f"\n# Neptune Analytics configuration\n{endpoint_line}\n"
             
-            logger.info(f"Updated {config_file}")
+            if write_if_changed(config_file, content):
+                logger.info(f"Updated {config_file}")
+            else:
+                logger.info(f"{config_file} is already up to date")
         
         # Update config.json if it exists
-        config_json = os.path.join(os.path.dirname(__file__), "..", "config.json")
-        if os.path.exists(config_json):
+        config_json = PROJECT_ROOT / "config.json"
+        if config_json.exists():
             logger.info(f"Updating {config_json}...")
             
-            import json
-            with open(config_json, "r") as f:
-                config = json.load(f)
+            with open(config_json, "rb") as f:
+                config = orjson.loads(f.read()) if orjson is not None else json.load(f)
             
             config["neptune_endpoint"] = target_endpoint
             
-            with open(config_json, "w") as f:
-                json.dump(config, f, indent=2)
+            # Serialize up front so the file is written in one call
+            if orjson is not None:
+                content = orjson.dumps(config, option=orjson.OPT_INDENT_2).decode("utf-8")
+            else:
+                content = json.dumps(config, indent=2)
             
-            logger.info(f"Updated {config_json}")
+            if write_if_changed(config_json, content):
+                logger.info(f"Updated {config_json}")
+            else:
+                logger.info(f"{config_json} is already up to date")
         
         logger.info("Neptune configuration updated successfully")
         return True
@@ -26,6 +26,12 @@ try:
 except ImportError:
     print("pysqlite3 not available, using system sqlite3")
 
+# Prefer orjson for serializing results
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Now try to import GraphRAG toolkit components
 try:
     from graphrag_toolkit.lexical_graph import LexicalGraphIndex, TenantId, GraphRAGConfig, set_logging_config
@@ -53,36 +59,50 @@ class DocumentReader:
             print(f"Error reading text file: {e}")
             return None
     
+    @staticmethod
+    def iter_pdf_pages(file_path):
+        """Yield the text of a PDF file one page at a time"""
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            yield from DocumentReader._iter_pdf_pages_pypdf2(file_path)
+            return
+        
+        # Keep MuPDF's default text flags and also join hyphenated line
+        # breaks, so callers need no cleanup pass
+        flags = fitz.TEXTFLAGS_TEXT | fitz.TEXT_DEHYPHENATE
+        with fitz.open(file_path) as doc:
+            for page in doc:
+                yield page.get_text("text", flags=flags)
+    
+    @staticmethod
+    def _iter_pdf_pages_pypdf2(file_path):
+        """Yield PDF page texts using PyPDF2 (slower, pure-Python fallback)"""
+        import PyPDF2
+        with open(file_path, 'rb') as f:
+            reader = PyPDF2.PdfReader(f)
+            for page in reader.pages:
+                yield page.extract_text()
+    
     @staticmethod
     def read_pdf_file(file_path):
-        """Read text from a PDF file"""
+        """Read text from a PDF file using PyMuPDF, falling back to PyPDF2"""
         try:
-            import PyPDF2
-            with open(file_path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n\n"
-                return text
+            return "\n\n".join(DocumentReader.iter_pdf_pages(file_path))
         except ImportError:
-            print("PyPDF2 not available. Cannot process PDF files.")
+            print("Neither PyMuPDF nor PyPDF2 is available. Cannot process PDF files.")
             return None
         except Exception as e:
             print(f"Error processing PDF: {e}")
             return None
     
     @staticmethod
-    def read_file(file_path):
-        """Read text from a file based on its extension"""
-        path = Path(file_path)
-        if not path.exists():
-            print(f"Error: File {file_path} not found")
-            return None
-            
+    def read_file(path: Path):
+        """Read text from a file based on its extension (the caller checks existence)"""
         if path.suffix.lower() == '.pdf':
-            return DocumentReader.read_pdf_file(file_path)
+            return DocumentReader.read_pdf_file(path)
         else:
-            return DocumentReader.read_text_file(file_path)
+            return DocumentReader.read_text_file(path)
 
 class GraphRAGFactExtractor:
     """Extract facts from documents using GraphRAG toolkit"""
@@ -144,19 +164,18 @@ class GraphRAGFactExtractor:
             print(f"Error initializing GraphRAG components: {e}")
             raise
     
-    def process_document(self, file_path, document_id=None):
+    def process_document(self, path: Path, document_id=None):
         """Process a document and extract facts"""
-        path = Path(file_path)
         if not document_id:
             document_id = path.stem
             
         try:
-            print(f"Processing document: {file_path}")
+            print(f"Processing document: {path}")
             
             # Read the document content
-            content = DocumentReader.read_file(file_path)
+            content = DocumentReader.read_file(path)
             if not content:
-                raise ValueError(f"Could not read content from {file_path}")
+                raise ValueError(f"Could not read content from {path}")
             
             # Create a Document object
             doc = Document(text=content, metadata={"source": str(path), "document_id": document_id})
@@ -311,9 +330,23 @@ class GraphRAGFactExtractor:
                 }
                 results["graph"] = graph_data
                 
-            # Save to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2)
+            # Save to a temporary file and atomically move it into place so an
+            # interrupted write never leaves a truncated JSON file behind
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+            try:
+                if orjson is not None:
+                    # OPT_NON_STR_KEYS accepts the int and other keys json.dump allows
+                    tmp_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    with open(tmp_file, 'w', encoding='utf-8') as f:
+                        json.dump(results, f, indent=2)
+                os.replace(tmp_file, output_file)
+            except BaseException:
+                # Don't leave a partial temporary file behind
+                tmp_file.unlink(missing_ok=True)
+                raise
                 
             print(f"Results saved to {output_path}")
             return True
@@ -14,21 +14,48 @@ import os
 import sys
 import json
 import argparse
+import functools
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Converters for scalar Neptune Analytics values, keyed by type tag
+_SCALAR_CONVERTERS = {
+    'stringValue': lambda v: v,
+    'integerValue': int,
+    'doubleValue': float,
+    'booleanValue': lambda v: v,
+    'nullValue': lambda v: None,
+}
+
+@functools.lru_cache(maxsize=4)
+def _neptune_graph_client(region):
+    """Get the shared neptune-graph client for a region, keeping its connections alive"""
+    # Import required libraries
+    import boto3
+    from botocore.config import Config
+    
+    # Configure boto3 client
+    config = Config(
+        region_name=region,
+        signature_version='v4',
+        tcp_keepalive=True,
+        max_pool_connections=20,
+        retries={
+            'max_attempts': 10,
+            'mode': 'standard'
+        }
+    )
+    
+    return boto3.client('neptune-graph', config=config)
+
 class NeptuneAnalyticsClient:
     """Client for querying Neptune Analytics graphs"""
     
     def __init__(self):
         """Initialize the Neptune Analytics client"""
         try:
-            # Import required libraries
-            import boto3
-            from botocore.config import Config
-            
             # Get Neptune Analytics configuration from environment
             neptune_graph_id = os.environ.get("NEPTUNE_ANALYTICS_GRAPH_ID")
             if not neptune_graph_id:
@@ -36,18 +63,8 @@ class NeptuneAnalyticsClient:
                 
             neptune_region = os.environ.get("NEPTUNE_ANALYTICS_REGION", "us-west-2")
             
-            # Configure boto3 client
-            config = Config(
-                region_name=neptune_region,
-                signature_version='v4',
-                retries={
-                    'max_attempts': 10,
-                    'mode': 'standard'
-                }
-            )
-            
-            # Create Neptune Analytics client
-            self.client = boto3.client('neptune-graph', config=config)
+            # Reuse the process-wide Neptune Analytics client
+            self.client = _neptune_graph_client(neptune_region)
             self.graph_id = neptune_graph_id
             
             print(f"Connected to Neptune Analytics graph: {self.graph_id}")
@@ -75,16 +92,12 @@ class NeptuneAnalyticsClient:
                 parameters=params
             )
             
-            # Process results
-            results = []
-            for record in response.get('results', []):
-                result_dict = {}
-                for key, value in record.items():
-                    # Convert Neptune Analytics value format to Python native types
-                    result_dict[key] = self._convert_value(value)
-                results.append(result_dict)
-                
-            return results
+            # Convert Neptune Analytics value format to Python native types
+            convert = self._convert_value
+            return [
+                {key: convert(value) for key, value in record.items()}
+                for record in response.get('results', ())
+            ]
             
         except Exception as e:
             print(f"Error executing query: {e}")
@@ -92,22 +105,17 @@ class NeptuneAnalyticsClient:
     
     def _convert_value(self, value):
         """Convert Neptune Analytics value format to Python native types"""
-        if 'stringValue' in value:
-            return value['stringValue']
-        elif 'integerValue' in value:
-            return int(value['integerValue'])
-        elif 'doubleValue' in value:
-            return float(value['doubleValue'])
-        elif 'booleanValue' in value:
-            return value['booleanValue']
-        elif 'listValue' in value:
-            return [self._convert_value(item) for item in value['listValue']]
-        elif 'mapValue' in value:
-            return {k: self._convert_value(v) for k, v in value['mapValue'].items()}
-        elif 'nullValue' in value:
-            return None
-        else:
-            return str(value)  # Default fallback
+        # Each value is a single-key union tagged with its type
+        if len(value) == 1:
+            (kind, item), = value.items()
+            converter = _SCALAR_CONVERTERS.get(kind)
+            if converter is not None:
+                return converter(item)
+            if kind == 'listValue':
+                return [self._convert_value(i) for i in item]
+            if kind == 'mapValue':
+                return {k: self._convert_value(v) for k, v in item.items()}
+        return str(value)  # Default fallback
 
 def run_example_queries(client, verbose=False):
     """Run example queries against Neptune Analytics"""
@@ -147,19 +155,25 @@ def run_example_queries(client, verbose=False):
         
         print("\nExample 3: Entities containing 'neural'")
         entities = client.execute_query(entity_query)
+        
+        # Get relationships for all matched entities in one round-trip
+        rel_query = """
+        UNWIND $ids AS id
+        MATCH (e1:Entity {id: id})-[r]->(e2:Entity)
+        WITH id, collect({target: e2.name, relationship: type(r)})[..10] AS rels
+        RETURN id, rels
+        """
+        
+        relationships_by_id = {}
+        if entities:
+            rel_rows = client.execute_query(
+                rel_query, parameters={'ids': [entity['id'] for entity in entities]}
+            )
+            relationships_by_id = {row['id']: row['rels'] for row in rel_rows}
+        
         for entity in entities:
             print(f"  {entity['name']} ({entity['type']})")
-            
-            # Get relationships for this entity
-            entity_id = entity['id']
-            rel_query = f"""
-            MATCH (e1:Entity {{id: '{entity_id}'}})-[r]->(e2:Entity)
-            RETURN e2.name as target, type(r) as relationship
-            LIMIT 10
-            """
-            
-            relationships = client.execute_query(rel_query)
-            for rel in relationships:
+            for rel in relationships_by_id.get(entity['id'], []):
                 print(f"    -{rel['relationship']}-> {rel['target']}")
     
     # Example 4: Get document information
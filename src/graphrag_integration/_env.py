@@ -0,0 +1,55 @@
+"""
+Process-wide environment loading for GraphRAG integration.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+
+def _load_frozen_env() -> Optional[Dict[str, str]]:
+    """
+    Get the .env values frozen by scripts/update_neptune_config.py.
+    
+    Returns:
+        Optional[Dict[str, str]]: The frozen values, or None if there is no
+        frozen module or .env has been modified since it was written
+    """
+    try:
+        from config import env_frozen
+    except ImportError:
+        return None
+    
+    frozen_file = Path(env_frozen.__file__).resolve()
+    env_file = frozen_file.parent.parent / ".env"
+    try:
+        if env_file.stat().st_mtime_ns > frozen_file.stat().st_mtime_ns:
+            return None
+    except FileNotFoundError:
+        pass
+    
+    return env_frozen.ENV
+
+
+@lru_cache(maxsize=1)
+def ensure_env_loaded() -> bool:
+    """
+    Load the .env file into the environment, at most once per process.
+    
+    The frozen config/env_frozen.py module is preferred when it is up to
+    date, since importing it from the bytecode cache avoids parsing .env.
+    Variables already set in the environment take precedence either way.
+    
+    Returns:
+        bool: True once the environment has been loaded
+    """
+    frozen = _load_frozen_env()
+    if frozen is None:
+        load_dotenv()
+    else:
+        for key, value in frozen.items():
+            os.environ.setdefault(key, value)
+    return True
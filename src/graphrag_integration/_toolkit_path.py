@@ -0,0 +1,25 @@
+"""
+Import path setup for the vendored GraphRAG lexical-graph sources.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+# Location of the lexical-graph sources linked into the lib directory
+GRAPHRAG_LEXICAL_GRAPH_SRC = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), '../../lib/graphrag-lexical-graph/src')
+)
+
+
+@lru_cache(maxsize=1)
+def ensure_toolkit_on_path() -> bool:
+    """
+    Add the lexical-graph sources to sys.path, once per process.
+    
+    Returns:
+        bool: True once the path is in place
+    """
+    if GRAPHRAG_LEXICAL_GRAPH_SRC not in sys.path:
+        sys.path.append(GRAPHRAG_LEXICAL_GRAPH_SRC)
+    return True
@@ -9,11 +9,14 @@ integration with Neptune Analytics.
 
 import os
 import logging
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from ._env import ensure_env_loaded
 
 # Load environment variables
-load_dotenv()
+ensure_env_loaded()
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -27,14 +30,24 @@ class GraphRAGConfig:
     DEFAULT_EMBED_DIMENSIONS = 1024
     DEFAULT_EXTRACTION_LLM = "anthropic.claude-3-sonnet-20240229-v1:0"
     DEFAULT_RESPONSE_LLM = "anthropic.claude-3-sonnet-20240229-v1:0"
+    DEFAULT_NAMESPACE = "cweb"
+    DEFAULT_CHUNK_SIZE = 1000
+    DEFAULT_CHUNK_OVERLAP = 200
+    DEFAULT_MAX_TOKENS_PER_CHUNK = 512
+    DEFAULT_NEPTUNE_PORT = 8182
     
     @staticmethod
-    def get_neptune_analytics_config() -> Dict[str, str]:
+    @lru_cache(maxsize=1)
+    def get_neptune_analytics_config() -> Mapping[str, str]:
         """
         Get Neptune Analytics configuration from environment variables.
         
+        The environment is read once per process and the same read-only
+        mapping is returned to every caller. s3_bucket and s3_prefix locate
+        the staging area for bulk loads, which are disabled without a bucket.
+        
         Returns:
-            Dict[str, str]: Neptune Analytics configuration
+            Mapping[str, str]: Neptune Analytics configuration
         """
         graph_id = os.environ.get("NEPTUNE_ANALYTICS_GRAPH_ID")
         region = os.environ.get("NEPTUNE_ANALYTICS_REGION", GraphRAGConfig.DEFAULT_AWS_REGION)
@@ -42,29 +55,35 @@ class GraphRAGConfig:
         if not graph_id:
             logger.warning("NEPTUNE_ANALYTICS_GRAPH_ID not found in environment variables")
         
-        return {
+        return MappingProxyType({
             "graph_id": graph_id,
             "region": region,
-            "connection_string": f"neptune-graph://{graph_id}" if graph_id else None
-        }
+            "connection_string": f"neptune-graph://{graph_id}" if graph_id else None,
+            "s3_bucket": os.environ.get("S3_BUCKET"),
+            "s3_prefix": os.environ.get("S3_PREFIX", "").strip("/")
+        })
     
     @staticmethod
-    def get_bedrock_config() -> Dict[str, str]:
+    @lru_cache(maxsize=1)
+    def get_bedrock_config() -> Mapping[str, str]:
         """
         Get Amazon Bedrock configuration from environment variables.
         
+        The environment is read once per process and the same read-only
+        mapping is returned to every caller.
+        
         Returns:
-            Dict[str, str]: Bedrock configuration
+            Mapping[str, str]: Bedrock configuration
         """
         region = os.environ.get("BEDROCK_REGION", GraphRAGConfig.DEFAULT_AWS_REGION)
         
-        return {
+        return MappingProxyType({
             "region": region,
             "embed_model": GraphRAGConfig.DEFAULT_EMBED_MODEL,
             "embed_dimensions": GraphRAGConfig.DEFAULT_EMBED_DIMENSIONS,
             "extraction_llm": GraphRAGConfig.DEFAULT_EXTRACTION_LLM,
             "response_llm": GraphRAGConfig.DEFAULT_RESPONSE_LLM
-        }
+        })
     
     @staticmethod
     def configure_graphrag_toolkit() -> bool:
@@ -106,3 +125,90 @@ class GraphRAGConfig:
         except Exception as e:
             logger.error(f"Error configuring GraphRAG toolkit: {e}")
             return False
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_graphrag_config() -> Mapping[str, Mapping[str, Any]]:
+        """
+        Get the combined configuration used by the GraphRAG integration modules.
+        
+        The configuration is shared process-wide, so the mapping and both of
+        its sections are read-only.
+        
+        Returns:
+            Mapping[str, Mapping[str, Any]]: Bedrock and lexical graph configuration
+        """
+        bedrock_config = GraphRAGConfig.get_bedrock_config()
+        
+        return MappingProxyType({
+            "bedrock": MappingProxyType({
+                "region": bedrock_config["region"],
+                "embedding_model": bedrock_config["embed_model"],
+                "embedding_dimensions": bedrock_config["embed_dimensions"],
+                "llm_model": bedrock_config["extraction_llm"]
+            }),
+            "lexical_graph": MappingProxyType({
+                "namespace": os.environ.get("GRAPHRAG_NAMESPACE", GraphRAGConfig.DEFAULT_NAMESPACE),
+                "chunk_size": GraphRAGConfig.DEFAULT_CHUNK_SIZE,
+                "chunk_overlap": GraphRAGConfig.DEFAULT_CHUNK_OVERLAP,
+                "max_tokens_per_chunk": GraphRAGConfig.DEFAULT_MAX_TOKENS_PER_CHUNK
+            })
+        })
+
+
+# Combined configuration, resolved once at import
+GRAPHRAG_CONFIG = GraphRAGConfig.get_graphrag_config()
+
+
+@lru_cache(maxsize=4)
+def get_bedrock_client(region: Optional[str] = None):
+    """
+    Get the shared Amazon Bedrock runtime client for a region.
+    
+    boto3 is imported on first use so that modules which only read
+    configuration do not pay its import cost. The client keeps its
+    connections alive and is sized for concurrent embedding and
+    extraction calls.
+    
+    Args:
+        region (str, optional): The AWS region (defaults to the Bedrock region)
+    
+    Returns:
+        boto3.client: The Bedrock runtime client
+    """
+    import boto3
+    from botocore.config import Config
+    
+    config = Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={
+            "max_attempts": 5,
+            "mode": "adaptive"
+        }
+    )
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=region or GRAPHRAG_CONFIG["bedrock"]["region"],
+        config=config
+    )
+
+
+@lru_cache(maxsize=1)
+def get_neptune_connection_info() -> Tuple[Optional[str], int, bool, str]:
+    """
+    Get Neptune connection settings from environment variables.
+    
+    Returns:
+        Tuple[Optional[str], int, bool, str]: Endpoint, port, whether to use
+        IAM authentication, and region
+    """
+    endpoint = os.environ.get("NEPTUNE_ENDPOINT")
+    port = int(os.environ.get("NEPTUNE_PORT", GraphRAGConfig.DEFAULT_NEPTUNE_PORT))
+    use_iam_auth = os.environ.get("NEPTUNE_AUTH_MODE", "IAM") == "IAM"
+    region = os.environ.get("NEPTUNE_REGION", GraphRAGConfig.DEFAULT_AWS_REGION)
+    
+    if not endpoint:
+        logger.warning("NEPTUNE_ENDPOINT not found in environment variables")
+    
+    return endpoint, port, use_iam_auth, region
@@ -3,12 +3,14 @@ Document processor for GraphRAG Toolkit integration.
 """
 
 import os
-import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
+from src.graphrag_integration._toolkit_path import ensure_toolkit_on_path
+
 # Add the GraphRAG lexical-graph to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../lib/graphrag-lexical-graph/src'))
+ensure_toolkit_on_path()
 
 # Import GraphRAG components
 try:
@@ -109,3 +111,20 @@ class CwebDocumentProcessor:
         
         # Process text
         return self.process_text(text, document_id, metadata)
+    
+    def process_files(self, file_paths: List[str], max_workers: int = 4) -> List[Document]:
+        """
+        Process several text files concurrently.
+        
+        Reading and chunking one file overlaps with the Bedrock embedding
+        calls of the others, which are network-bound.
+        
+        Args:
+            file_paths (List[str]): Paths to the text files
+            max_workers (int, optional): Maximum number of files processed at once
+            
+        Returns:
+            List[Document]: The processed documents, in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.process_file, file_paths))
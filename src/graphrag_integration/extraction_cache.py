@@ -0,0 +1,116 @@
+"""
+Content-addressable cache for GraphRAG fact extraction results.
+"""
+
+import os
+import json
+import struct
+import hashlib
+import logging
+import tempfile
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class ExtractionCache:
+    """
+    Disk cache of extracted facts, keyed by document text and extraction settings.
+    """
+    
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the extraction cache.
+        
+        Args:
+            cache_dir (str): Directory holding one JSON file per cache entry
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def make_key(text: str, *parts: str) -> str:
+        """
+        Compute the cache key for a document and its extraction settings.
+        
+        Each field is prefixed with its 8-byte length, so the document text
+        and the settings can never run together into the same byte stream.
+        
+        Args:
+            text (str): The document text
+            *parts (str): Extraction settings, e.g. model ID and namespace
+        
+        Returns:
+            str: The hex SHA-256 cache key
+        """
+        digest = hashlib.sha256()
+        for field in (text, *parts):
+            data = field.encode('utf-8')
+            digest.update(struct.pack('>Q', len(data)))
+            digest.update(data)
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> str:
+        """
+        Get the file path for a cache key.
+        
+        Args:
+            key (str): The cache key
+        
+        Returns:
+            str: Path to the cache entry
+        """
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the cached fact records for a key.
+        
+        Args:
+            key (str): The cache key
+        
+        Returns:
+            Optional[List[Dict[str, Any]]]: The fact records, or None on a miss
+            or an unreadable entry
+        """
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable extraction cache entry {key}: {e}")
+            return None
+        
+        records = entry.get("facts") if isinstance(entry, dict) else None
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            logger.warning(f"Ignoring malformed extraction cache entry {key}")
+            return None
+        
+        return records
+    
+    def put(self, key: str, records: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store fact records under a key.
+        
+        Args:
+            key (str): The cache key
+            records (List[Dict[str, Any]]): JSON-serializable fact records
+            metadata (Dict[str, Any], optional): Extraction settings to record
+        """
+        entry = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "metadata": metadata or {},
+            "facts": records
+        }
+        
+        # Write atomically so concurrent extractors never read a partial entry;
+        # each writer gets its own temporary file, even for the same key
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.cache_dir)
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -3,12 +3,16 @@ Fact extractor for GraphRAG Toolkit integration.
 """
 
 import os
-import sys
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import List, Dict, Any, Optional, Tuple
 
+from src.graphrag_integration._toolkit_path import ensure_toolkit_on_path
+
 # Add the GraphRAG lexical-graph to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../lib/graphrag-lexical-graph/src'))
+ensure_toolkit_on_path()
 
 # Import GraphRAG components
 try:
@@ -24,17 +28,28 @@ except ImportError:
     )
 
 from src.graphrag_integration.config import GRAPHRAG_CONFIG, get_bedrock_client
+from src.graphrag_integration.extraction_cache import ExtractionCache
 
 logger = logging.getLogger(__name__)
 
+# Retries after the first attempt when the LLM output fails validation
+MAX_EXTRACTION_RETRIES = 2
+
+# Bump when extraction output changes so stale cache entries stop matching
+EXTRACTION_CACHE_VERSION = "v1"
+
 class CwebFactExtractor:
     """
     Fact extractor for CWEB project using GraphRAG Toolkit.
     """
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
         """
         Initialize the fact extractor.
+        
+        Args:
+            cache_dir (str, optional): Directory for caching extraction results
+                (defaults to CWEB_EXTRACTION_CACHE_DIR; caching is off if neither is set)
         """
         self.config = GRAPHRAG_CONFIG
         self.bedrock_client = get_bedrock_client()
@@ -50,6 +65,49 @@ class CwebFactExtractor:
             llm=self.llm,
             namespace=self.config["lexical_graph"]["namespace"]
         )
+        
+        # Initialize extraction cache
+        cache_dir = cache_dir or os.environ.get("CWEB_EXTRACTION_CACHE_DIR")
+        self.cache = ExtractionCache(cache_dir) if cache_dir else None
+    
+    @cached_property
+    def doc_processor(self) -> "CwebDocumentProcessor":
+        """
+        Get the document processor, created on first use and then reused.
+        
+        Returns:
+            CwebDocumentProcessor: The document processor
+        """
+        from src.graphrag_integration.document_processor import CwebDocumentProcessor
+        
+        return CwebDocumentProcessor()
+    
+    def _extract_with_retry(self, document: Document) -> List[Fact]:
+        """
+        Run the toolkit extractor, retrying when the LLM output fails validation.
+        
+        Malformed LLM output surfaces as a ValueError (including pydantic's
+        ValidationError); a fresh attempt usually succeeds, which is far
+        cheaper than failing the whole document.
+        
+        Args:
+            document (Document): The document to extract facts from
+        
+        Returns:
+            List[Fact]: The extracted facts
+        """
+        for attempt in range(MAX_EXTRACTION_RETRIES + 1):
+            try:
+                return self.extractor.extract_facts(document)
+            except ValueError as e:
+                if attempt == MAX_EXTRACTION_RETRIES:
+                    raise
+                delay = 1.0 * (attempt + 1)
+                logger.warning(
+                    f"Invalid fact extraction output for {document.id} ({e}), "
+                    f"retrying in {delay:.0f}s"
+                )
+                time.sleep(delay)
     
     def extract_facts(self, document: Document) -> List[Fact]:
         """
@@ -57,15 +115,61 @@ class CwebFactExtractor:
         
         Args:
             document (Document): The document to extract facts from
-            
+        
         Returns:
             List[Fact]: The extracted facts
         """
+        if self.cache is None:
+            return self._extract_with_retry(document)
+        
+        model_id = self.config["bedrock"]["llm_model"]
+        namespace = self.config["lexical_graph"]["namespace"]
+        
+        # Facts carry their document's provenance, so the document ID is part
+        # of the key and documents with the same text do not share entries
+        key = ExtractionCache.make_key(document.text, str(document.id), model_id, namespace, EXTRACTION_CACHE_VERSION)
+        
+        # Reuse facts extracted earlier from the same document and settings
+        records = self.cache.get(key)
+        if records is not None:
+            try:
+                return [Fact.model_validate(record) for record in records]
+            except Exception as e:
+                logger.warning(f"Discarding invalid extraction cache entry {key}: {e}")
+        
         # Extract facts from document
-        facts = self.extractor.extract_facts(document)
+        facts = self._extract_with_retry(document)
+        
+        # The facts are already paid for, so a failed cache write only costs a later re-extraction
+        try:
+            self.cache.put(
+                key,
+                [fact.model_dump(mode="json") for fact in facts],
+                metadata={"llm_model": model_id, "namespace": namespace, "version": EXTRACTION_CACHE_VERSION}
+            )
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry {key}: {e}")
         
         return facts
     
+    def extract_facts_many(self, documents: List[Document], max_workers: int = 5) -> List[List[Fact]]:
+        """
+        Extract facts from several documents concurrently.
+        
+        Each extraction is a network-bound Bedrock LLM call, so running them
+        in parallel overlaps the round trips instead of waiting on each one.
+        
+        Args:
+            documents (List[Document]): The documents to extract facts from
+            max_workers (int, optional): Maximum number of LLM calls in flight,
+                to stay within Bedrock quotas
+        
+        Returns:
+            List[List[Fact]]: The extracted facts for each document, in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.extract_facts, documents))
+    
     def extract_facts_from_text(self, text: str, document_id: str, metadata: Optional[Dict[str, Any]] = None) -> Tuple[Document, List[Fact]]:
         """
         Extract facts from text.
@@ -74,15 +178,12 @@ class CwebFactExtractor:
             text (str): The text to extract facts from
             document_id (str): The document ID
             metadata (Dict[str, Any], optional): Document metadata
-            
+        
         Returns:
             Tuple[Document, List[Fact]]: The processed document and extracted facts
         """
-        from src.graphrag_integration.document_processor import CwebDocumentProcessor
-        
         # Process text
-        processor = CwebDocumentProcessor()
-        document = processor.process_text(text, document_id, metadata)
+        document = self.doc_processor.process_text(text, document_id, metadata)
         
         # Extract facts
         facts = self.extract_facts(document)
@@ -97,15 +198,12 @@ class CwebFactExtractor:
             file_path (str): Path to the text file
             document_id (str, optional): The document ID (defaults to file name)
             metadata (Dict[str, Any], optional): Document metadata
-            
+        
         Returns:
             Tuple[Document, List[Fact]]: The processed document and extracted facts
         """
-        from src.graphrag_integration.document_processor import CwebDocumentProcessor
-        
         # Process file
-        processor = CwebDocumentProcessor()
-        document = processor.process_file(file_path, document_id, metadata)
+        document = self.doc_processor.process_file(file_path, document_id, metadata)
         
         # Extract facts
         facts = self.extract_facts(document)
@@ -3,12 +3,13 @@ Lexical graph builder for GraphRAG Toolkit integration.
 """
 
 import os
-import sys
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 
+from src.graphrag_integration._toolkit_path import ensure_toolkit_on_path
+
 # Add the GraphRAG lexical-graph to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../lib/graphrag-lexical-graph/src'))
+ensure_toolkit_on_path()
 
 # Import GraphRAG components
 try:
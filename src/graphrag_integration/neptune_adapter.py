@@ -3,12 +3,15 @@ Neptune adapter for GraphRAG Toolkit integration.
 """
 
 import os
-import sys
 import logging
+import threading
+from functools import cached_property
 from typing import Optional
 
+from src.graphrag_integration._toolkit_path import ensure_toolkit_on_path
+
 # Add the GraphRAG lexical-graph to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../lib/graphrag-lexical-graph/src'))
+ensure_toolkit_on_path()
 
 # Import GraphRAG components
 try:
@@ -27,6 +30,9 @@ logger = logging.getLogger(__name__)
 class NeptuneAdapter:
     """
     Neptune adapter for CWEB project using GraphRAG Toolkit.
+    
+    The graph and vector store connect on first use, and concurrent first
+    accesses share a single connection.
     """
     
     def __init__(self):
@@ -38,21 +44,61 @@ class NeptuneAdapter:
         
         # Get Neptune connection info
         endpoint, port, use_iam_auth, region = get_neptune_connection_info()
+        self._connection_kwargs = {
+            "endpoint": endpoint,
+            "port": port,
+            "use_iam_auth": use_iam_auth,
+            "region": region,
+            "namespace": self.namespace
+        }
+        self._init_lock = threading.Lock()
+    
+    def _connect(self, name: str, factory):
+        """
+        Create a store once, even if several threads ask for it at the same time.
         
-        # Initialize Neptune graph
-        self.graph = NeptuneGraph(
-            endpoint=endpoint,
-            port=port,
-            use_iam_auth=use_iam_auth,
-            region=region,
-            namespace=self.namespace
-        )
+        Args:
+            name (str): The attribute name the store is cached under
+            factory: The store class to instantiate
+            
+        Returns:
+            The cached store
+        """
+        with self._init_lock:
+            # Another thread may have connected while this one waited
+            store = self.__dict__.get(name)
+            if store is None:
+                store = factory(**self._connection_kwargs)
+                self.__dict__[name] = store
+            return store
+    
+    @cached_property
+    def graph(self) -> NeptuneGraph:
+        """
+        Get the Neptune graph, connecting on first use.
         
-        # Initialize Neptune vector store
-        self.vector_store = NeptuneVectorStore(
-            endpoint=endpoint,
-            port=port,
-            use_iam_auth=use_iam_auth,
-            region=region,
-            namespace=self.namespace
-        )
+        Returns:
+            NeptuneGraph: The Neptune graph
+        """
+        return self._connect("graph", NeptuneGraph)
+    
+    @cached_property
+    def vector_store(self) -> NeptuneVectorStore:
+        """
+        Get the Neptune vector store, connecting on first use.
+        
+        Returns:
+            NeptuneVectorStore: The Neptune vector store
+        """
+        return self._connect("vector_store", NeptuneVectorStore)
+    
+    def close(self) -> None:
+        """
+        Close the graph and vector store; the next access reconnects.
+        """
+        with self._init_lock:
+            for name in ("graph", "vector_store"):
+                store = self.__dict__.pop(name, None)
+                close = getattr(store, "close", None)
+                if close is not None:
+                    close()
@@ -2,24 +2,254 @@
 Evidence management module for storing and retrieving evidence in Neptune Analytics.
 """
 
+import os
+import csv
+import copy
+import json
 import uuid
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
 from typing import Dict, List, Optional, Any
-import boto3
-from gremlin_python.process.anonymous_traversal import traversal
-from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
 
 from config.neptune_config import (
-    GRAPHRAG_CONFIG, 
     EVIDENCE_LABEL, 
-    get_neptune_connection_string
+    VECTOR_DIMENSION,
+    get_config,
+    get_neptune_connection_string,
+    get_signed_request_headers
 )
 
+# Gremlin driver names, imported by _load_gremlin on first use so that
+# importing this module (e.g. for Evidence alone) stays cheap
+traversal = None
+DriverRemoteConnection = None
+AiohttpTransport = None
+__ = None
+T = None
+P = None
+Cardinality = None
+
+def _load_gremlin():
+    """
+    Import the Gremlin driver names that are still unset (tests may patch them).
+    """
+    global traversal, DriverRemoteConnection, AiohttpTransport, __, T, P, Cardinality
+    if traversal is None:
+        from gremlin_python.process.anonymous_traversal import traversal
+    if DriverRemoteConnection is None:
+        from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
+    if AiohttpTransport is None:
+        from gremlin_python.driver.aiohttp.transport import AiohttpTransport
+    if __ is None:
+        from gremlin_python.process.graph_traversal import __
+    if T is None or P is None or Cardinality is None:
+        from gremlin_python.process.traversal import T, P, Cardinality
+
+def _signing_transport_factory():
+    """
+    Get a transport factory whose transports sign their own WebSocket handshake.
+    
+    The driver creates a transport for every connection it opens, including
+    reconnects of a long-lived shared connection, so each handshake carries
+    SigV4 headers signed when it is made instead of headers that expire a few
+    minutes after the first connection.
+    
+    Returns:
+        A callable returning a new signing transport
+    """
+    class SigningTransport(AiohttpTransport):
+        def connect(self, url, headers=None):
+            signed = dict(headers or {})
+            signed.update(get_signed_request_headers(url))
+            return super().connect(url, signed)
+    
+    return SigningTransport
+
+# GraphRAG vector store class, imported by the vector_store property on
+# first use unless set here (tests may patch it)
+NeptuneVectorStore = None
+
+def _encode_metadata(metadata: Optional[Dict[str, Any]]) -> str:
+    """
+    Serialize evidence metadata for the graph's string-valued metadata property.
+    
+    Args:
+        metadata: The evidence metadata
+    
+    Returns:
+        The metadata as a JSON string
+    """
+    return json.dumps(metadata or {})
+
+def _decode_metadata(value: Any) -> Dict[str, Any]:
+    """
+    Deserialize a graph metadata property written by _encode_metadata.
+    
+    Args:
+        value: The stored property value
+    
+    Returns:
+        The evidence metadata
+    """
+    if not value:
+        return {}
+    if isinstance(value, str):
+        return json.loads(value)
+    return dict(value)
+
+# Gremlin connections shared by all EvidenceStore instances, keyed by
+# connection string, with the number of stores using each one
+_connection_pool: Dict[str, Any] = {}
+_connection_refs: Dict[str, int] = {}
+_connection_lock = threading.Lock()
+
+def _acquire_connection(connection_string: str):
+    """
+    Get the shared connection for a connection string, opening it if needed.
+    
+    Args:
+        connection_string: The Gremlin connection string
+    
+    Returns:
+        The shared DriverRemoteConnection
+    """
+    with _connection_lock:
+        connection = _connection_pool.get(connection_string)
+        if connection is None:
+            _load_gremlin()
+            kwargs = {}
+            if get_config().auth_mode.upper() == 'IAM':
+                kwargs['transport_factory'] = _signing_transport_factory()
+            connection = DriverRemoteConnection(connection_string, 'g', pool_size=8, max_workers=16, **kwargs)
+            _connection_pool[connection_string] = connection
+            _connection_refs[connection_string] = 0
+        _connection_refs[connection_string] += 1
+        return connection
+
+def _release_connection(connection_string: str):
+    """
+    Release a shared connection, closing it once no store uses it.
+    
+    Args:
+        connection_string: The Gremlin connection string
+    """
+    with _connection_lock:
+        refs = _connection_refs.get(connection_string, 0) - 1
+        if refs > 0:
+            _connection_refs[connection_string] = refs
+            return
+        _connection_refs.pop(connection_string, None)
+        connection = _connection_pool.pop(connection_string, None)
+    if connection is not None:
+        connection.close()
+
+# Worker threads for concurrent graph writes; bounds the
+# Gremlin traversals in flight during add_evidence_batch
+WRITE_CONCURRENCY = 16
+
+# Batches at least this large are written through the Neptune bulk loader
+# via S3 instead of Gremlin, when an S3 bucket is configured
+BULK_LOAD_THRESHOLD = 10000
+
+@lru_cache(maxsize=4)
+def _neptune_graph_client(region: str):
+    """
+    Get the shared neptune-graph client for a region.
+    
+    Args:
+        region: AWS region of the graph
+    
+    Returns:
+        boto3 neptune-graph client
+    """
+    import boto3
+    from botocore.config import Config
+    
+    config = Config(region_name=region, tcp_keepalive=True, retries={'mode': 'standard'})
+    return boto3.client('neptune-graph', config=config)
+
+@lru_cache(maxsize=4)
+def _s3_client(region: str):
+    """
+    Get the shared S3 client for a region, used to stage bulk-load files.
+    
+    Args:
+        region: AWS region of the bucket
+    
+    Returns:
+        boto3 S3 client
+    """
+    import boto3
+    
+    return boto3.client('s3', region_name=region)
+
+def _neptune_analytics_config():
+    """
+    Get the Neptune Analytics graph ID, region and bulk-load bucket, imported
+    on first use.
+    
+    Returns:
+        The read-only Neptune Analytics configuration
+    """
+    from src.graphrag_integration.config import GraphRAGConfig
+    
+    return GraphRAGConfig.get_neptune_analytics_config()
+
+def _bulk_load_graph() -> Dict[str, Any]:
+    """
+    Get the Neptune Analytics configuration for a bulk load, checking that it
+    names the graph Gremlin writes go to.
+    
+    Bulk loads target NEPTUNE_ANALYTICS_GRAPH_ID and Gremlin writes target
+    NEPTUNE_ENDPOINT, so both must name the same graph or a batch crossing
+    BULK_LOAD_THRESHOLD would land in a different graph.
+    
+    Returns:
+        The read-only Neptune Analytics configuration
+    
+    Raises:
+        ValueError: If the graph ID is unset or differs from NEPTUNE_ENDPOINT's graph
+    """
+    config = _neptune_analytics_config()
+    graph_id = config["graph_id"]
+    if not graph_id:
+        raise ValueError("NEPTUNE_ANALYTICS_GRAPH_ID must be set for bulk loads")
+    
+    # Neptune Analytics endpoints are <graph-id>.<region>.neptune-graph.amazonaws.com
+    endpoint_graph_id = (get_config().endpoint or '').split('.', 1)[0]
+    if endpoint_graph_id != graph_id:
+        raise ValueError(
+            f"Bulk loads go to graph {graph_id!r} (NEPTUNE_ANALYTICS_GRAPH_ID) but Gremlin "
+            f"writes go to NEPTUNE_ENDPOINT {get_config().endpoint!r}; they must name the same graph"
+        )
+    return config
+
+# Evidence objects kept per store by get_evidence/get_evidence_many.
+# Each EvidenceStore has its own cache, and only its own writes invalidate
+# entries, so evidence rewritten through another store or process may be
+# served stale until evicted. Callers get copies of the cached objects
+EVIDENCE_CACHE_SIZE = 4096
+
+# Vertex properties fetched when hydrating Evidence objects
+EVIDENCE_FIELDS = ('id', 'content', 'source', 'metadata')
+
+# Vertices chained into a single Gremlin traversal by add_evidence_batch;
+# Neptune recommends bundling 50-100 writes per request
+EVIDENCE_BATCH_SIZE = 64
+
 
 class Evidence:
     """
     Class representing a piece of evidence in the system.
     """
     
+    __slots__ = ('content', 'source', 'metadata', 'evidence_id')
+    
     def __init__(
         self, 
         content: str, 
@@ -41,6 +271,39 @@ class Evidence:
         self.metadata = metadata or {}
         self.evidence_id = evidence_id or f"evidence-{str(uuid.uuid4())}"
     
+    def copy(self) -> 'Evidence':
+        """
+        Copy the evidence, including a deep copy of its metadata.
+        
+        Returns:
+            A new Evidence object with the same fields
+        """
+        evidence = Evidence.__new__(Evidence)
+        evidence.content = self.content
+        evidence.source = self.source
+        evidence.metadata = copy.deepcopy(self.metadata)
+        evidence.evidence_id = self.evidence_id
+        return evidence
+    
+    @classmethod
+    def from_metadata_dict(cls, metadata: Dict[str, Any]) -> 'Evidence':
+        """
+        Build evidence from a dictionary produced by to_dict, as stored in
+        vector-store metadata.
+        
+        Args:
+            metadata: Dict representation of the evidence
+        
+        Returns:
+            Evidence object
+        """
+        evidence = cls.__new__(cls)
+        evidence.content = metadata.get('content', '')
+        evidence.source = metadata.get('source', '')
+        evidence.metadata = metadata.get('metadata') or {}
+        evidence.evidence_id = metadata.get('id') or f"evidence-{str(uuid.uuid4())}"
+        return evidence
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the evidence to a dictionary.
@@ -55,6 +318,19 @@ class Evidence:
             "metadata": self.metadata,
             "label": EVIDENCE_LABEL
         }
+    
+    @property
+    def key(self) -> int:
+        """
+        Stable 64-bit integer key derived from the evidence ID, for indexes
+        that want integer keys.
+        
+        Returns:
+            The 8-byte BLAKE2b digest of the ID (BLAKE2b with digest_size=8,
+            not a truncated 64-byte digest), as a little-endian int
+        """
+        digest = hashlib.blake2b(self.evidence_id.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
 
 
 class EvidenceStore:
@@ -62,48 +338,110 @@ class EvidenceStore:
     Store for managing evidence in Neptune Analytics.
     """
     
-    def __init__(self):
+    def __init__(self, ann_backend: Optional[str] = None):
         """
         Initialize the EvidenceStore with Neptune connections.
+        
+        Args:
+            ann_backend: Set to "usearch" (HNSW) or "exact" (brute-force cosine
+                over int8-quantized vectors with float32 reranking)
+                to answer similarity searches from an in-process index instead
+                of the Neptune vector store; the index covers evidence added
+                through this instance
         """
-        # Initialize Gremlin connection for graph operations
-        self.connection = DriverRemoteConnection(get_neptune_connection_string(), 'g')
-        self.g = traversal().withRemote(self.connection)
+        # The Gremlin connection is shared and only acquired on first use
+        self._connection_string = get_neptune_connection_string()
+        self._init_lock = threading.Lock()
         
         # Initialize GraphRAG components when needed
         self._vector_store = None
-        self._graph_store = None
+        
+        # Buffered (evidence, embedding) pairs while a batch is open
+        self._batch = None
+        
+        # Recently read evidence by ID, least recently used first
+        self._evidence_cache: OrderedDict = OrderedDict()
+        self._evidence_cache_lock = threading.Lock()
+        
+        # Bumped by every write, so reads that overlapped one are not cached
+        self._evidence_generation = 0
+        
+        # Optional in-process index. Evidence fields are mirrored column by
+        # column, so results are built without another round-trip. _ann_rows
+        # maps Evidence.key to a position in these lists, which is also the
+        # exact index row; usearch is keyed by Evidence.key itself. Rewritten
+        # evidence keeps its position. _ann_lock guards the index and columns
+        self._ann_backend = ann_backend
+        self._ann_index = None
+        self._ann_lock = threading.Lock()
+        self._ann_rows: Dict[int, int] = {}
+        self._ann_ids: List[str] = []
+        self._ann_contents: List[str] = []
+        self._ann_sources: List[str] = []
+        self._ann_metadata: List[Dict[str, Any]] = []
+        if ann_backend == "exact":
+            from .vector_index import VectorIndex
+            self._ann_index = VectorIndex(VECTOR_DIMENSION, quantize=True)
+        elif ann_backend == "usearch":
+            try:
+                from usearch.index import Index, MetricKind
+            except ImportError as e:
+                raise ImportError("The usearch ANN backend requires the usearch package") from e
+            self._ann_index = Index(
+                ndim=VECTOR_DIMENSION,
+                metric=MetricKind.Cos,
+                connectivity=16,
+                expansion_add=64,
+                expansion_search=100
+            )
+        elif ann_backend is not None:
+            raise ValueError(f"Unsupported ANN backend: {ann_backend}")
+    
+    @cached_property
+    def connection(self):
+        """Shared Gremlin connection, acquired from the pool on first use"""
+        with self._init_lock:
+            # Another thread may have acquired it while this one waited
+            connection = self.__dict__.get('connection')
+            if connection is None:
+                connection = _acquire_connection(self._connection_string)
+                self.__dict__['connection'] = connection
+            return connection
+    
+    @cached_property
+    def g(self):
+        """Gremlin traversal source bound to the shared connection"""
+        connection = self.connection
+        _load_gremlin()
+        return traversal().withRemote(connection)
+    
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Worker threads for concurrent writes, created on first use"""
+        with self._init_lock:
+            executor = self.__dict__.get('_executor')
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=WRITE_CONCURRENCY, thread_name_prefix='evidence-write')
+                self.__dict__['_executor'] = executor
+            return executor
     
     @property
     def vector_store(self):
         """Lazy initialization of vector store"""
         if self._vector_store is None:
-            from graphrag.vector_store.neptune import NeptuneVectorStore
+            store_class = NeptuneVectorStore
+            if store_class is None:
+                from graphrag.vector_store.neptune import NeptuneVectorStore as store_class
             
-            vector_config = GRAPHRAG_CONFIG["vector_store"]["config"]
-            self._vector_store = NeptuneVectorStore(
-                endpoint=vector_config["endpoint"],
-                port=vector_config["port"],
-                region=vector_config["region"],
-                vector_dimension=vector_config["vector_dimension"]
+            config = get_config()
+            self._vector_store = store_class(
+                endpoint=config.endpoint,
+                port=config.port,
+                region=config.region,
+                vector_dimension=VECTOR_DIMENSION
             )
         return self._vector_store
     
-    @property
-    def graph_store(self):
-        """Lazy initialization of graph store"""
-        if self._graph_store is None:
-            from graphrag.graph_store.neptune import NeptuneGraphStore
-            
-            graph_config = GRAPHRAG_CONFIG["graph_store"]["config"]
-            self._graph_store = NeptuneGraphStore(
-                endpoint=graph_config["endpoint"],
-                port=graph_config["port"],
-                region=graph_config["region"],
-                namespace=graph_config["namespace"]
-            )
-        return self._graph_store
-    
     def add_evidence(self, evidence: Evidence, embedding: List[float]) -> str:
         """
         Add evidence to both vector store and graph.
@@ -111,24 +449,280 @@ class EvidenceStore:
         Args:
             evidence: The Evidence object to add
             embedding: Vector embedding of the evidence content
-            
+        
         Returns:
             ID of the added evidence
         """
-        # Add to vector store
+        # Defer the write while a batch is open
+        if self._batch is not None:
+            self._batch.append((evidence, embedding))
+            return evidence.evidence_id
+        
+        # Both stores take the same dictionary, so build it once
+        record = evidence.to_dict()
+        
+        # Write the vertex first, the same way add_evidence_batch does, so a
+        # failed graph write leaves no vector behind for it
+        _load_gremlin()
+        self._add_vertices(self.g, [record])
+        
         vector_id = self.vector_store.add_vector(
             id=evidence.evidence_id,
             vector=embedding,
-            metadata=evidence.to_dict()
+            metadata=record
         )
+        self._forget_cached([evidence.evidence_id])
+        self._index_embeddings([evidence], [embedding])
+        
+        return vector_id
+    
+    def add_evidence_batch(self, evidences: List[Evidence], embeddings: List[List[float]]) -> List[str]:
+        """
+        Add many pieces of evidence with one bulk vector-store call and one
+        Gremlin traversal per EVIDENCE_BATCH_SIZE vertices.
+        
+        Args:
+            evidences: The Evidence objects to add
+            embeddings: Vector embeddings, one per evidence
+        
+        Returns:
+            IDs of the added evidence, in input order
+        """
+        if len(evidences) != len(embeddings):
+            raise ValueError("evidences and embeddings must have the same length")
+        if not evidences:
+            return []
+        
+        records = [evidence.to_dict() for evidence in evidences]
+        
+        # The graph is written first, so a failed graph write leaves no vectors
+        # behind; cached copies are dropped even if it fails part way
+        try:
+            if len(records) >= BULK_LOAD_THRESHOLD and _neptune_analytics_config()["s3_bucket"]:
+                # Large batches bypass Gremlin and commit once through the bulk loader
+                self._bulk_load(records)
+            else:
+                # Chain upserts so each chunk is one round-trip, with chunks in flight concurrently
+                _load_gremlin()
+                g = self.g
+                graph_futures = [
+                    self._executor.submit(self._add_vertices, g, records[start:start + EVIDENCE_BATCH_SIZE])
+                    for start in range(0, len(records), EVIDENCE_BATCH_SIZE)
+                ]
+                for future in graph_futures:
+                    future.result()
+        finally:
+            self._forget_cached([record["id"] for record in records])
+        
+        vector_ids = self._add_vectors(self.vector_store, records, embeddings)
+        self._index_embeddings(evidences, embeddings)
         
-        # Add to graph store
-        self.graph_store.add_vertex(
-            label=EVIDENCE_LABEL,
-            properties=evidence.to_dict()
+        return vector_ids
+    
+    @staticmethod
+    def _add_vectors(vector_store, records: List[Dict[str, Any]], embeddings: List[List[float]]) -> List[str]:
+        """
+        Add evidence vectors to the vector store, in bulk when it supports it.
+        
+        Args:
+            vector_store: The vector store to write to
+            records: Evidence dictionaries, as returned by Evidence.to_dict
+            embeddings: Vector embeddings, one per record
+        
+        Returns:
+            IDs of the added vectors
+        """
+        add_vectors = getattr(vector_store, 'add_vectors', None)
+        if add_vectors is not None:
+            return list(add_vectors([
+                (record["id"], embedding, record)
+                for record, embedding in zip(records, embeddings)
+            ]))
+        return [
+            vector_store.add_vector(id=record["id"], vector=embedding, metadata=record)
+            for record, embedding in zip(records, embeddings)
+        ]
+    
+    @staticmethod
+    def _add_vertices(g, records: List[Dict[str, Any]]):
+        """
+        Add or overwrite evidence vertices in a single Gremlin traversal.
+        
+        Each vertex is upserted by ID, since Neptune rejects addV for an ID
+        that already exists, and its properties are set with single cardinality.
+        
+        Args:
+            g: The Gremlin traversal source
+            records: Evidence dictionaries, as returned by Evidence.to_dict
+        """
+        t = g
+        for record in records:
+            t = t.V(record["id"]).fold() \
+                .coalesce(__.unfold(), __.addV(EVIDENCE_LABEL).property(T.id, record["id"])) \
+                .property(Cardinality.single, 'id', record["id"]) \
+                .property(Cardinality.single, 'content', record["content"]) \
+                .property(Cardinality.single, 'source', record["source"]) \
+                .property(Cardinality.single, 'metadata', _encode_metadata(record["metadata"]))
+        t.iterate()
+    
+    def _bulk_load(self, records: List[Dict[str, Any]]):
+        """
+        Write evidence vertices to a bulk-load CSV in S3 and load it into the graph.
+        
+        The file is staged under <s3_bucket>/<s3_prefix>/evidence/ from the
+        Neptune Analytics configuration, in the graph's region, and the local
+        copy is always removed. The graph must be the one NEPTUNE_ENDPOINT
+        names (see _bulk_load_graph).
+        
+        Args:
+            records: Evidence dictionaries, as returned by Evidence.to_dict
+        """
+        config = _bulk_load_graph()
+        bucket, prefix = config["s3_bucket"], config["s3_prefix"]
+        key = '/'.join(part for part in (prefix, 'evidence', f"{uuid.uuid4()}.csv") if part)
+        
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        try:
+            with open(fd, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['~id', '~label', 'id:String', 'content:String', 'source:String', 'metadata:String'])
+                writer.writerows(
+                    (record["id"], EVIDENCE_LABEL, record["id"], record["content"], record["source"], _encode_metadata(record["metadata"]))
+                    for record in records
+                )
+            _s3_client(config["region"]).upload_file(path, bucket, key)
+        finally:
+            os.remove(path)
+        
+        self.bulk_load_from_s3(f"s3://{bucket}/{key}")
+    
+    def bulk_load_from_s3(self, s3_uri: str) -> Dict[str, Any]:
+        """
+        Load bulk-load CSV files from S3 into the graph as a single batch.
+        
+        The target is NEPTUNE_ANALYTICS_GRAPH_ID, which must be the graph
+        NEPTUNE_ENDPOINT names. The loaded IDs are not known here, so the
+        whole read cache is dropped.
+        
+        Args:
+            s3_uri: S3 URI of a CSV file or of a prefix holding CSV files
+        
+        Returns:
+            The load summary reported by Neptune Analytics
+        
+        Raises:
+            ValueError: If the bulk-load graph is unset or differs from NEPTUNE_ENDPOINT's
+        """
+        config = _bulk_load_graph()
+        graph_id, region = config["graph_id"], config["region"]
+        
+        # neptune.load runs synchronously and fails the query if any row fails
+        query = (
+            f"CALL neptune.load({{format: 'csv', source: {json.dumps(s3_uri)}, "
+            f"region: {json.dumps(region)}, failOnError: true}})"
         )
+        try:
+            response = _neptune_graph_client(region).execute_query(
+                graphIdentifier=graph_id,
+                language='OPEN_CYPHER',
+                queryString=query
+            )
+        finally:
+            with self._evidence_cache_lock:
+                self._evidence_generation += 1
+                self._evidence_cache.clear()
+        return json.loads(response['payload'].read())
+    
+    def _index_embeddings(self, evidences: List[Evidence], embeddings: List[List[float]]):
+        """
+        Add evidence to the in-process index and its columns, if one is configured.
         
-        return vector_id
+        Evidence whose ID is already indexed replaces its earlier vector and
+        fields in place. Metadata is copied, so later changes to the caller's
+        dictionary do not reach the index. The index is updated before the
+        columns and row map, so a failed index update leaves the columns as
+        they were.
+        
+        Args:
+            evidences: The Evidence objects the embeddings belong to
+            embeddings: Vector embeddings, one per evidence
+        """
+        if self._ann_index is None:
+            return
+        import numpy as np
+        
+        # The last write of an ID within the call wins
+        latest = {evidence.key: (evidence, embedding) for evidence, embedding in zip(evidences, embeddings)}
+        
+        with self._ann_lock:
+            replaced = [key for key in latest if key in self._ann_rows]
+            added = [key for key in latest if key not in self._ann_rows]
+            
+            if self._ann_backend == "exact":
+                if replaced:
+                    self._ann_index.replace(
+                        [self._ann_rows[key] for key in replaced],
+                        [latest[key][1] for key in replaced]
+                    )
+                if added:
+                    self._ann_index.add([latest[key][1] for key in added])
+            else:
+                if replaced:
+                    self._ann_index.remove(np.asarray(replaced, dtype=np.uint64))
+                keys = replaced + added
+                self._ann_index.add(
+                    np.asarray(keys, dtype=np.uint64),
+                    np.asarray([latest[key][1] for key in keys], dtype=np.float32)
+                )
+            
+            for key in replaced:
+                evidence = latest[key][0]
+                row = self._ann_rows[key]
+                self._ann_contents[row] = evidence.content
+                self._ann_sources[row] = evidence.source
+                self._ann_metadata[row] = copy.deepcopy(evidence.metadata)
+            for key in added:
+                evidence = latest[key][0]
+                self._ann_rows[key] = len(self._ann_ids)
+                self._ann_ids.append(evidence.evidence_id)
+                self._ann_contents.append(evidence.content)
+                self._ann_sources.append(evidence.source)
+                self._ann_metadata.append(copy.deepcopy(evidence.metadata))
+    
+    def begin_batch(self):
+        """
+        Start buffering add_evidence calls until end_batch is called.
+        """
+        if self._batch is None:
+            self._batch = []
+    
+    def end_batch(self) -> List[str]:
+        """
+        Write all evidence buffered since begin_batch.
+        
+        Returns:
+            IDs of the added evidence
+        """
+        pending, self._batch = self._batch or [], None
+        if not pending:
+            return []
+        evidences, embeddings = zip(*pending)
+        return self.add_evidence_batch(list(evidences), list(embeddings))
+    
+    @contextmanager
+    def batch(self):
+        """
+        Context manager buffering add_evidence calls and flushing them on exit.
+        
+        Buffered evidence is discarded if the block raises.
+        """
+        self.begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self._batch = None
+            raise
+        self.end_batch()
     
     def get_evidence(self, evidence_id: str) -> Optional[Evidence]:
         """
@@ -136,22 +730,92 @@ class EvidenceStore:
         
         Args:
             evidence_id: ID of the evidence to retrieve
-            
+        
         Returns:
             Evidence object if found, None otherwise
         """
-        result = self.g.V().hasLabel(EVIDENCE_LABEL).has('id', evidence_id).valueMap(True).toList()
+        result = self.get_evidence_many([evidence_id])
+        return result[0] if result else None
+    
+    def get_evidence_many(self, evidence_ids: List[str]) -> List[Evidence]:
+        """
+        Retrieve several pieces of evidence, fetching any not in the read
+        cache with a single Gremlin traversal.
         
-        if not result:
-            return None
+        The cache belongs to this store and is not shared with other stores
+        on the same connection, so see EVIDENCE_CACHE_SIZE on staleness.
         
-        properties = result[0]
-        return Evidence(
-            content=properties.get('content', [''])[0],
-            source=properties.get('source', [''])[0],
-            metadata=properties.get('metadata', [{}])[0],
-            evidence_id=properties.get('id')
-        )
+        Args:
+            evidence_ids: IDs of the evidence to retrieve
+        
+        Returns:
+            Evidence objects in the order of evidence_ids, skipping unknown
+            IDs; each is a copy the caller may modify without affecting the cache
+        """
+        if not evidence_ids:
+            return []
+        
+        # Serve what we can from the cache and fetch only the misses
+        with self._evidence_cache_lock:
+            generation = self._evidence_generation
+            by_id = {}
+            for evidence_id in evidence_ids:
+                evidence = self._evidence_cache.get(evidence_id)
+                if evidence is not None:
+                    self._evidence_cache.move_to_end(evidence_id)
+                    by_id[evidence_id] = evidence
+        missing = [evidence_id for evidence_id in dict.fromkeys(evidence_ids) if evidence_id not in by_id]
+        
+        if missing:
+            fetched = self._fetch_evidence(missing)
+            by_id.update(fetched)
+            with self._evidence_cache_lock:
+                # A write since the cache was read may have raced the fetch,
+                # so its result could already be stale; return it uncached
+                if self._evidence_generation == generation:
+                    self._evidence_cache.update(fetched)
+                    while len(self._evidence_cache) > EVIDENCE_CACHE_SIZE:
+                        self._evidence_cache.popitem(last=False)
+        
+        return [by_id[evidence_id].copy() for evidence_id in evidence_ids if evidence_id in by_id]
+    
+    def _fetch_evidence(self, evidence_ids: List[str]) -> Dict[str, Evidence]:
+        """
+        Fetch evidence from the graph with a single Gremlin traversal.
+        
+        Args:
+            evidence_ids: IDs of the evidence to fetch
+        
+        Returns:
+            Evidence objects by ID, for the IDs that exist
+        """
+        # Project only the Evidence fields, as flat values, in one round-trip
+        _load_gremlin()
+        t = self.g.V().hasLabel(EVIDENCE_LABEL).has('id', P.within(evidence_ids)).project(*EVIDENCE_FIELDS)
+        for field in EVIDENCE_FIELDS:
+            t = t.by(field)
+        
+        by_id = {}
+        for row in t.toList():
+            by_id[row['id']] = Evidence(
+                content=row.get('content', ''),
+                source=row.get('source', ''),
+                metadata=_decode_metadata(row.get('metadata')),
+                evidence_id=row['id']
+            )
+        return by_id
+    
+    def _forget_cached(self, evidence_ids: List[str]):
+        """
+        Drop evidence from the read cache after it has been written again.
+        
+        Args:
+            evidence_ids: IDs of the written evidence
+        """
+        with self._evidence_cache_lock:
+            self._evidence_generation += 1
+            for evidence_id in evidence_ids:
+                self._evidence_cache.pop(evidence_id, None)
     
     def search_similar_evidence(self, query_embedding: List[float], top_k: int = 5) -> List[Evidence]:
         """
@@ -160,31 +824,49 @@ class EvidenceStore:
         Args:
             query_embedding: Vector embedding of the query
             top_k: Number of results to return
-            
+        
         Returns:
             List of Evidence objects
         """
+        if self._ann_index is not None:
+            with self._ann_lock:
+                if not self._ann_ids:
+                    return []
+                if self._ann_backend == "exact":
+                    rows, _ = self._ann_index.search(query_embedding, top_k)
+                else:
+                    import numpy as np
+                    keys = self._ann_index.search(np.asarray(query_embedding, dtype=np.float32), top_k).keys
+                    rows = [self._ann_rows[int(key)] for key in keys]
+                # Materialize Evidence only for the top_k rows, with metadata
+                # copied so callers cannot change the indexed columns
+                return [
+                    Evidence(
+                        content=self._ann_contents[row],
+                        source=self._ann_sources[row],
+                        metadata=copy.deepcopy(self._ann_metadata[row]),
+                        evidence_id=self._ann_ids[row]
+                    )
+                    for row in map(int, rows)
+                ]
+        
         results = self.vector_store.search_vectors(
             query_vector=query_embedding,
             top_k=top_k
         )
         
-        evidence_list = []
-        for result in results:
-            metadata = result.get('metadata', {})
-            evidence = Evidence(
-                content=metadata.get('content', ''),
-                source=metadata.get('source', ''),
-                metadata=metadata.get('metadata', {}),
-                evidence_id=metadata.get('id')
-            )
-            evidence_list.append(evidence)
-        
-        return evidence_list
+        from_metadata_dict = Evidence.from_metadata_dict
+        return [from_metadata_dict(result.get('metadata', {})) for result in results]
     
     def close(self):
         """
-        Close connections.
+        Release the shared connection, closing it if no other store uses it.
         """
-        if hasattr(self, 'connection') and self.connection:
-            self.connection.close()
+        with self._init_lock:
+            connection = self.__dict__.pop('connection', None)
+            self.__dict__.pop('g', None)
+            executor = self.__dict__.pop('_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if connection is not None:
+            _release_connection(self._connection_string)
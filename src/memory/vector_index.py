@@ -0,0 +1,204 @@
+"""
+In-process cosine similarity index for evidence embeddings.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+# Rows converted from int8 to float32 at a time during a quantized scan, so
+# the float32 working set stays in cache while RAM traffic is int8
+_SCAN_BLOCK_ROWS = 4096
+
+# Quantized candidates reranked with float32 vectors, per requested result
+RERANK_FACTOR = 4
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize vectors symmetrically to int8 with one scale per vector.
+    
+    Args:
+        vectors: Array of shape (n, dimension)
+    
+    Returns:
+        The int8 codes and float32 scales; codes * scales[:, None]
+        approximates the input
+    """
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the indices of the k highest scores, highest first.
+    
+    Partitions in O(n) and sorts only the k selected scores, instead of
+    sorting every score.
+    
+    Args:
+        scores: One-dimensional array of scores
+        k: Number of indices to return
+    
+    Returns:
+        Indices of the top k scores in descending score order
+    """
+    if k >= scores.shape[0]:
+        return np.argsort(-scores)
+    top = np.argpartition(-scores, k)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+class VectorIndex:
+    """
+    Brute-force cosine index over a contiguous float32 matrix.
+    
+    Vectors are normalized on insert and stored row by row in one C-ordered
+    array, so a query is a single matrix-vector product dispatched to BLAS.
+    With quantize=True a query first scans int8 copies of the rows, a quarter
+    of the bytes, and reranks the best candidates with the float32 rows.
+    """
+    
+    def __init__(self, dimension: int, initial_capacity: int = 1024, quantize: bool = False):
+        """
+        Initialize an empty index.
+        
+        Args:
+            dimension: Dimension of the indexed vectors
+            initial_capacity: Number of rows to preallocate
+            quantize: Scan int8-quantized rows and rerank with float32
+        """
+        self.dimension = dimension
+        self.quantize = quantize
+        capacity = max(initial_capacity, 1)
+        self._vectors = np.empty((capacity, dimension), dtype=np.float32)
+        self._codes = np.empty((capacity, dimension), dtype=np.int8) if quantize else None
+        self._scales = np.empty(capacity, dtype=np.float32) if quantize else None
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _reserve(self, rows: int):
+        """
+        Grow the backing array, doubling it, until it can hold `rows` rows.
+        
+        Args:
+            rows: Number of rows required
+        """
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        vectors = np.empty((capacity, self.dimension), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        self._vectors = vectors
+        if self.quantize:
+            codes = np.empty((capacity, self.dimension), dtype=np.int8)
+            codes[:self._size] = self._codes[:self._size]
+            self._codes = codes
+            scales = np.empty(capacity, dtype=np.float32)
+            scales[:self._size] = self._scales[:self._size]
+            self._scales = scales
+    
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """
+        Scale vectors to unit length, leaving zero vectors unchanged.
+        
+        Args:
+            vectors: Array of shape (n, dimension)
+        
+        Returns:
+            The normalized float32 array
+        """
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).astype(np.float32, copy=False)
+    
+    def add(self, vectors: List[List[float]]) -> np.ndarray:
+        """
+        Add vectors to the index.
+        
+        Args:
+            vectors: Vectors to add, each of length `dimension`
+        
+        Returns:
+            Row numbers assigned to the vectors
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimension)
+        start = self._size
+        end = start + vectors.shape[0]
+        self._reserve(end)
+        self._vectors[start:end] = self._normalize(vectors)
+        if self.quantize:
+            self._codes[start:end], self._scales[start:end] = quantize_int8(self._vectors[start:end])
+        self._size = end
+        return np.arange(start, end)
+    
+    def replace(self, rows: List[int], vectors: List[List[float]]):
+        """
+        Overwrite existing rows with new vectors.
+        
+        Args:
+            rows: Row numbers returned by add
+            vectors: Replacement vectors, one per row, each of length `dimension`
+        """
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimension)
+        if rows.shape[0] != vectors.shape[0]:
+            raise ValueError("rows and vectors must have the same length")
+        if rows.size and (rows.min() < 0 or rows.max() >= self._size):
+            raise IndexError("row out of range")
+        normalized = self._normalize(vectors)
+        self._vectors[rows] = normalized
+        if self.quantize:
+            self._codes[rows], self._scales[rows] = quantize_int8(normalized)
+    
+    def search(self, query: List[float], top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the rows most similar to a query vector.
+        
+        Args:
+            query: The query vector
+            top_k: Number of rows to return
+        
+        Returns:
+            Row numbers and cosine similarities, best match first
+        """
+        top_k = min(top_k, self._size)
+        if top_k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        
+        query = self._normalize(np.asarray(query, dtype=np.float32).reshape(1, self.dimension))[0]
+        if not self.quantize:
+            scores = self._vectors[:self._size] @ query
+            rows = top_k_indices(scores, top_k)
+            return rows, scores[rows]
+        
+        # Shortlist with the int8 scan, then rerank the shortlist exactly
+        candidates = top_k_indices(self._quantized_scores(query), top_k * RERANK_FACTOR)
+        scores = self._vectors[candidates] @ query
+        order = top_k_indices(scores, top_k)
+        return candidates[order], scores[order]
+    
+    def _quantized_scores(self, query: np.ndarray) -> np.ndarray:
+        """
+        Approximate the cosine similarity of every row from the int8 codes.
+        
+        Args:
+            query: The normalized query vector
+        
+        Returns:
+            Approximate similarities, one per row
+        """
+        scores = np.empty(self._size, dtype=np.float32)
+        for start in range(0, self._size, _SCAN_BLOCK_ROWS):
+            end = min(start + _SCAN_BLOCK_ROWS, self._size)
+            scores[start:end] = self._codes[start:end].astype(np.float32) @ query
+        scores *= self._scales[:self._size]
+        return scores
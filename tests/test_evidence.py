@@ -2,12 +2,29 @@
 Unit tests for the Evidence module.
 """
 
+import os
+import json
 import unittest
 import uuid
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, DEFAULT
+import boto3
+from config import neptune_config
+from src.memory import evidence as evidence_module
 from src.memory.evidence import Evidence, EvidenceStore
 
 
+# Neptune Analytics settings naming the graph of the test NEPTUNE_ENDPOINT
+ANALYTICS_CONFIG = {'graph_id': 'test-endpoint', 'region': 'us-east-1', 's3_bucket': 'test-bucket', 's3_prefix': ''}
+
+
+class RecordingTransport:
+    """Stands in for the driver's aiohttp transport, recording each handshake."""
+    
+    def connect(self, url, headers=None):
+        self.url = url
+        self.headers = headers
+
+
 class TestEvidence(unittest.TestCase):
     """Test cases for the Evidence class."""
     
@@ -48,21 +65,86 @@ class TestEvidence(unittest.TestCase):
         self.assertEqual(evidence_dict["source"], source)
         self.assertEqual(evidence_dict["metadata"], metadata)
         self.assertEqual(evidence_dict["label"], "Evidence")
+    
+    def test_from_metadata_dict(self):
+        """Test rebuilding evidence from its dictionary form."""
+        evidence = Evidence("Test content", "Test source", {"key": "value"}, "test-id-123")
+        rebuilt = Evidence.from_metadata_dict(evidence.to_dict())
+        
+        self.assertEqual(rebuilt.to_dict(), evidence.to_dict())
+        self.assertFalse(hasattr(rebuilt, '__dict__'))
+    
+    def test_copy(self):
+        """Test that copies do not share metadata with the original."""
+        evidence = Evidence("Test content", "Test source", {"tags": ["a"]}, "test-id-123")
+        copied = evidence.copy()
+        copied.metadata["tags"].append("b")
+        
+        self.assertEqual(copied.evidence_id, evidence.evidence_id)
+        self.assertEqual(evidence.metadata, {"tags": ["a"]})
+    
+    def test_key(self):
+        """Test that evidence keys are stable 64-bit integers."""
+        evidence = Evidence("Test content", "Test source", evidence_id="test-id-123")
+        
+        self.assertEqual(evidence.key, Evidence("Other", "Other", evidence_id="test-id-123").key)
+        self.assertNotEqual(evidence.key, Evidence("Test content", "Test source").key)
+        self.assertTrue(0 <= evidence.key < 2 ** 64)
 
 
 class TestEvidenceStore(unittest.TestCase):
     """Test cases for the EvidenceStore class."""
     
-    @patch('src.memory.evidence.DriverRemoteConnection')
-    @patch('src.memory.evidence.traversal')
-    def setUp(self, mock_traversal, mock_connection):
+    @classmethod
+    def setUpClass(cls):
+        """Patch the Gremlin driver and connection pool once for all tests."""
+        driver_patcher = patch.multiple(
+            'src.memory.evidence',
+            DriverRemoteConnection=DEFAULT,
+            traversal=DEFAULT,
+            __=DEFAULT,
+            T=DEFAULT,
+            P=DEFAULT,
+            Cardinality=DEFAULT,
+            AiohttpTransport=RecordingTransport,
+            get_signed_request_headers=DEFAULT
+        )
+        mocks = driver_patcher.start()
+        cls.addClassCleanup(driver_patcher.stop)
+        cls.mock_connection = mocks['DriverRemoteConnection']
+        cls.mock_traversal = mocks['traversal']
+        cls.mock_sign = mocks['get_signed_request_headers']
+        cls.mock_anonymous = mocks['__']
+        
+        # Point the configuration at a test endpoint, read afresh for these tests
+        env_patcher = patch.dict(os.environ, {
+            'NEPTUNE_ENDPOINT': 'test-endpoint.neptune.amazonaws.com',
+            'NEPTUNE_AUTH_MODE': 'IAM',
+            'NEPTUNE_REGION': 'us-west-2'
+        })
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
+        evidence_module.get_config.cache_clear()
+        cls.addClassCleanup(evidence_module.get_config.cache_clear)
+        
+        for name in ('_connection_pool', '_connection_refs'):
+            pool_patcher = patch.dict(f'src.memory.evidence.{name}', clear=True)
+            pool_patcher.start()
+            cls.addClassCleanup(pool_patcher.stop)
+    
+    def setUp(self):
         """Set up test fixtures."""
-        self.mock_traversal = mock_traversal
-        self.mock_connection = mock_connection
+        # Start every test with fresh mocks
+        self.mock_connection.reset_mock()
+        self.mock_traversal.reset_mock()
+        self.mock_sign.reset_mock(side_effect=True)
+        self.mock_anonymous.reset_mock()
+        
         self.mock_g = MagicMock()
-        mock_traversal.return_value.withRemote.return_value = self.mock_g
+        self.mock_traversal.return_value.withRemote.return_value = self.mock_g
         
         self.evidence_store = EvidenceStore()
+        self.addCleanup(self.evidence_store.close)
     
     def test_initialization(self):
         """Test that EvidenceStore is initialized correctly."""
@@ -79,28 +161,24 @@ class TestEvidenceStore(unittest.TestCase):
         mock_vector_store.assert_called_once()
         self.assertIsNotNone(vector_store)
     
-    @patch('src.memory.evidence.NeptuneGraphStore')
-    def test_graph_store_lazy_initialization(self, mock_graph_store):
-        """Test lazy initialization of graph store."""
-        # Access graph_store property to trigger lazy initialization
-        graph_store = self.evidence_store.graph_store
-        
-        # Verify NeptuneGraphStore was instantiated
-        mock_graph_store.assert_called_once()
-        self.assertIsNotNone(graph_store)
+    def _written_metadata(self):
+        """Get the metadata property values written by chained upsert traversals."""
+        return [
+            call.args[2] for call in self.mock_g.mock_calls
+            if call[0].endswith('.property') and call.args[1] == 'metadata'
+        ]
     
     def test_add_evidence(self):
         """Test adding evidence to the store."""
-        # Mock the vector_store and graph_store
+        # Mock the vector_store
         self.evidence_store._vector_store = MagicMock()
-        self.evidence_store._graph_store = MagicMock()
         
         # Create test evidence
         evidence = Evidence("Test content", "Test source")
         embedding = [0.1, 0.2, 0.3]
         
         # Add evidence
-        result = self.evidence_store.add_evidence(evidence, embedding)
+        self.evidence_store.add_evidence(evidence, embedding)
         
         # Verify vector_store.add_vector was called
         self.evidence_store._vector_store.add_vector.assert_called_once_with(
@@ -109,17 +187,162 @@ class TestEvidenceStore(unittest.TestCase):
             metadata=evidence.to_dict()
         )
         
-        # Verify graph_store.add_vertex was called
-        self.evidence_store._graph_store.add_vertex.assert_called_once_with(
-            label="Evidence",
-            properties=evidence.to_dict()
+        # Verify the vertex was written with one upsert traversal
+        self.mock_g.V.assert_called_once_with(evidence.evidence_id)
+        self.mock_anonymous.addV.assert_called_once_with("Evidence")
+        self.assertEqual(self._written_metadata(), [json.dumps(evidence.metadata)])
+    
+    def test_add_evidence_rewrite_upserts_vertex(self):
+        """Test that re-adding an existing ID upserts its vertex instead of adding another."""
+        self.evidence_store._vector_store = MagicMock()
+        self.evidence_store.add_evidence(Evidence("Old content", "Source", evidence_id="evidence-1"), [0.1, 0.2])
+        self.mock_g.reset_mock()
+        self.mock_anonymous.reset_mock()
+        
+        self.evidence_store.add_evidence(Evidence("New content", "Source", evidence_id="evidence-1"), [0.3, 0.4])
+        
+        # g.V(id).fold().coalesce(__.unfold(), __.addV(label).property(T.id, id))
+        self.mock_g.V.assert_called_once_with("evidence-1")
+        coalesce = self.mock_g.V.return_value.fold.return_value.coalesce
+        coalesce.assert_called_once_with(
+            self.mock_anonymous.unfold.return_value,
+            self.mock_anonymous.addV.return_value.property.return_value
         )
+        self.mock_anonymous.addV.assert_called_once_with("Evidence")
+        self.mock_anonymous.addV.return_value.property.assert_called_once_with(evidence_module.T.id, "evidence-1")
+        
+        # Fields are overwritten with single cardinality, then the traversal runs
+        upserted = coalesce.return_value
+        upserted.property.assert_called_once_with(evidence_module.Cardinality.single, 'id', "evidence-1")
+        content = upserted.property.return_value.property
+        content.assert_called_once_with(evidence_module.Cardinality.single, 'content', "New content")
+        content.return_value.property.return_value.property.return_value.iterate.assert_called_once_with()
+    
+    def test_add_evidence_graph_failure_skips_vector(self):
+        """Test that no vector is written when the graph write fails."""
+        self.evidence_store._vector_store = MagicMock()
+        self.mock_g.V.side_effect = RuntimeError("graph write failed")
+        
+        with self.assertRaises(RuntimeError):
+            self.evidence_store.add_evidence(Evidence("Content", "Source"), [0.1, 0.2])
+        
+        self.evidence_store._vector_store.add_vector.assert_not_called()
+    
+    def test_add_evidence_matches_batch_storage(self):
+        """Test that single and batched writes store metadata the same way."""
+        self.evidence_store._vector_store = MagicMock()
+        evidence = Evidence("Content", "Source", {"key": "value"})
+        
+        self.evidence_store.add_evidence(evidence, [0.1, 0.2])
+        self.evidence_store.add_evidence_batch([evidence], [[0.1, 0.2]])
+        
+        self.assertEqual(self._written_metadata(), ['{"key": "value"}', '{"key": "value"}'])
+    
+    def test_add_evidence_batch(self):
+        """Test adding many pieces of evidence in bulk."""
+        self.evidence_store._vector_store = MagicMock()
+        self.evidence_store._vector_store.add_vectors.return_value = ['evidence-1', 'evidence-2']
+        
+        evidences = [
+            Evidence("Content 1", "Source 1", evidence_id="evidence-1"),
+            Evidence("Content 2", "Source 2", evidence_id="evidence-2")
+        ]
+        embeddings = [[0.1, 0.2], [0.3, 0.4]]
+        
+        result = self.evidence_store.add_evidence_batch(evidences, embeddings)
+        
+        # One bulk vector-store call and one graph traversal for the whole batch
+        self.assertEqual(result, ['evidence-1', 'evidence-2'])
+        self.evidence_store._vector_store.add_vectors.assert_called_once()
+        self.mock_g.V.assert_called_once_with("evidence-1")
+    
+    @patch('src.memory.evidence._neptune_analytics_config', return_value=ANALYTICS_CONFIG)
+    @patch.object(evidence_module, 'BULK_LOAD_THRESHOLD', 2)
+    @patch.object(EvidenceStore, '_bulk_load')
+    def test_add_evidence_batch_bulk_load(self, mock_bulk_load, mock_analytics_config):
+        """Test that large batches go through the bulk loader instead of Gremlin."""
+        self.evidence_store._vector_store = MagicMock()
+        
+        evidences = [Evidence("Content 1", "Source 1"), Evidence("Content 2", "Source 2")]
+        self.evidence_store.add_evidence_batch(evidences, [[0.1, 0.2], [0.3, 0.4]])
+        
+        mock_bulk_load.assert_called_once_with([evidence.to_dict() for evidence in evidences])
+        self.mock_g.V.assert_not_called()
+    
+    @patch.object(evidence_module, 'BULK_LOAD_THRESHOLD', 1)
+    @patch('src.memory.evidence._neptune_analytics_config', return_value=ANALYTICS_CONFIG)
+    @patch.object(EvidenceStore, '_bulk_load', side_effect=RuntimeError("load failed"))
+    def test_add_evidence_batch_failure_forgets_cached(self, mock_bulk_load, mock_analytics_config):
+        """Test that a failed graph write still drops cached copies of the batch."""
+        mock_to_list = self.mock_g.V().hasLabel().has().project().by().by().by().by().toList
+        mock_to_list.return_value = [{'id': 'evidence-1', 'content': 'Old content', 'source': 'Source', 'metadata': {}}]
+        self.evidence_store.get_evidence("evidence-1")
+        self.evidence_store._vector_store = MagicMock()
+        
+        with self.assertRaises(RuntimeError):
+            self.evidence_store.add_evidence_batch([Evidence("New content", "Source", evidence_id="evidence-1")], [[0.1]])
+        
+        self.assertNotIn("evidence-1", self.evidence_store._evidence_cache)
+        self.evidence_store._vector_store.add_vectors.assert_not_called()
+    
+    @patch('src.memory.evidence._neptune_analytics_config', return_value=ANALYTICS_CONFIG)
+    @patch('src.memory.evidence._s3_client')
+    def test_bulk_load_removes_spill_file(self, mock_s3_client, mock_analytics_config):
+        """Test that the bulk-load CSV is removed even when the upload fails."""
+        mock_s3_client.return_value.upload_file.side_effect = RuntimeError("upload failed")
+        
+        with self.assertRaises(RuntimeError):
+            self.evidence_store._bulk_load([Evidence("Content", "Source").to_dict()])
+        
+        mock_s3_client.assert_called_once_with('us-east-1')
+        self.assertEqual(mock_s3_client.return_value.upload_file.call_args.args[1], 'test-bucket')
+        path = mock_s3_client.return_value.upload_file.call_args.args[0]
+        self.assertFalse(os.path.exists(path))
+    
+    @patch('src.memory.evidence._neptune_analytics_config', return_value=ANALYTICS_CONFIG)
+    @patch('src.memory.evidence._neptune_graph_client')
+    def test_bulk_load_from_s3(self, mock_graph_client, mock_analytics_config):
+        """Test that bulk loads target the configured Neptune Analytics graph."""
+        mock_graph_client.return_value.execute_query.return_value = {'payload': MagicMock(read=lambda: b'{}')}
+        
+        self.evidence_store.bulk_load_from_s3('s3://test-bucket/evidence/')
+        
+        mock_graph_client.assert_called_once_with('us-east-1')
+        kwargs = mock_graph_client.return_value.execute_query.call_args.kwargs
+        self.assertEqual(kwargs['graphIdentifier'], 'test-endpoint')
+        self.assertIn('region: "us-east-1"', kwargs['queryString'])
+    
+    @patch('src.memory.evidence._neptune_analytics_config', return_value=dict(ANALYTICS_CONFIG, graph_id='g-other'))
+    @patch('src.memory.evidence._neptune_graph_client')
+    def test_bulk_load_rejects_other_graph(self, mock_graph_client, mock_analytics_config):
+        """Test that bulk loads fail when they would target a graph other than NEPTUNE_ENDPOINT's."""
+        with self.assertRaises(ValueError):
+            self.evidence_store.bulk_load_from_s3('s3://test-bucket/evidence/')
+        mock_graph_client.assert_not_called()
+    
+    def test_add_evidence_batch_length_mismatch(self):
+        """Test that mismatched evidence and embedding lists are rejected."""
+        with self.assertRaises(ValueError):
+            self.evidence_store.add_evidence_batch([Evidence("Content", "Source")], [])
+    
+    def test_batch_buffers_add_evidence(self):
+        """Test that add_evidence calls inside a batch are written on exit."""
+        self.evidence_store._vector_store = MagicMock()
+        
+        with self.evidence_store.batch():
+            evidence_id = self.evidence_store.add_evidence(Evidence("Content", "Source"), [0.1, 0.2])
+            self.evidence_store._vector_store.add_vectors.assert_not_called()
+        
+        self.assertTrue(evidence_id.startswith("evidence-"))
+        self.evidence_store._vector_store.add_vectors.assert_called_once()
+        self.evidence_store._vector_store.add_vector.assert_not_called()
+        self.mock_g.V.assert_called_once()
     
     def test_get_evidence(self):
         """Test retrieving evidence by ID."""
         # Mock the Gremlin traversal
-        mock_result = [{'id': 'evidence-123', 'content': ['Test content'], 'source': ['Test source'], 'metadata': [{}]}]
-        self.mock_g.V().hasLabel().has().valueMap().toList.return_value = mock_result
+        mock_result = [{'id': 'evidence-123', 'content': 'Test content', 'source': 'Test source', 'metadata': '{}'}]
+        self.mock_g.V().hasLabel().has().project().by().by().by().by().toList.return_value = mock_result
         
         # Get evidence
         evidence = self.evidence_store.get_evidence("evidence-123")
@@ -129,6 +352,132 @@ class TestEvidenceStore(unittest.TestCase):
         self.assertEqual(evidence.evidence_id, 'evidence-123')
         self.assertEqual(evidence.content, 'Test content')
         self.assertEqual(evidence.source, 'Test source')
+        self.mock_g.V().hasLabel().has().project.assert_called_with('id', 'content', 'source', 'metadata')
+    
+    def test_get_evidence_cached(self):
+        """Test that repeated reads are served from the cache until rewritten."""
+        mock_to_list = self.mock_g.V().hasLabel().has().project().by().by().by().by().toList
+        mock_to_list.return_value = [{'id': 'evidence-123', 'content': 'Test content', 'source': 'Test source', 'metadata': {}}]
+        
+        first = self.evidence_store.get_evidence("evidence-123")
+        first.metadata["key"] = "changed"
+        second = self.evidence_store.get_evidence("evidence-123")
+        self.assertIsNot(first, second)
+        self.assertEqual(second.metadata, {})
+        self.assertEqual(mock_to_list.call_count, 1)
+        
+        # Writing the same ID again drops the cached copy
+        self.evidence_store._vector_store = MagicMock()
+        self.evidence_store.add_evidence(Evidence("New content", "Test source", evidence_id="evidence-123"), [0.1])
+        self.evidence_store.get_evidence("evidence-123")
+        self.assertEqual(mock_to_list.call_count, 2)
+    
+    def test_get_evidence_not_cached_across_write(self):
+        """Test that a read overlapping a write of the same ID is not cached."""
+        mock_to_list = self.mock_g.V().hasLabel().has().project().by().by().by().by().toList
+        
+        def write_during_read():
+            # The read sees the old value, then the write lands before it is cached
+            self.evidence_store._forget_cached(["evidence-123"])
+            return [{'id': 'evidence-123', 'content': 'Old content', 'source': 'Test source', 'metadata': {}}]
+        
+        mock_to_list.side_effect = write_during_read
+        self.assertEqual(self.evidence_store.get_evidence("evidence-123").content, 'Old content')
+        
+        mock_to_list.side_effect = None
+        mock_to_list.return_value = [{'id': 'evidence-123', 'content': 'New content', 'source': 'Test source', 'metadata': {}}]
+        self.assertEqual(self.evidence_store.get_evidence("evidence-123").content, 'New content')
+    
+    def test_get_evidence_missing(self):
+        """Test retrieving evidence that does not exist."""
+        self.mock_g.V().hasLabel().has().project().by().by().by().by().toList.return_value = []
+        self.assertIsNone(self.evidence_store.get_evidence("evidence-404"))
+    
+    def test_get_evidence_many(self):
+        """Test retrieving several pieces of evidence in one traversal."""
+        mock_result = [
+            {'id': 'evidence-2', 'content': 'Content 2', 'source': 'Source 2', 'metadata': '{}'},
+            {'id': 'evidence-1', 'content': 'Content 1', 'source': 'Source 1', 'metadata': {}}
+        ]
+        self.mock_g.V().hasLabel().has().project().by().by().by().by().toList.return_value = mock_result
+        
+        results = self.evidence_store.get_evidence_many(['evidence-1', 'evidence-3', 'evidence-2'])
+        
+        # Results follow the requested order and skip unknown IDs
+        self.assertEqual([evidence.evidence_id for evidence in results], ['evidence-1', 'evidence-2'])
+        self.assertEqual(results[1].metadata, {})
+    
+    def test_unsupported_ann_backend(self):
+        """Test that an unknown ANN backend is rejected."""
+        with self.assertRaises(ValueError):
+            EvidenceStore(ann_backend="faiss")
+    
+    def test_search_similar_evidence_in_process(self):
+        """Test that the in-process index builds results from its own columns."""
+        store = EvidenceStore()
+        self.addCleanup(store.close)
+        store._ann_backend = "exact"
+        store._ann_index = MagicMock()
+        store._ann_index.search.return_value = ([1, 0], [0.9, 0.5])
+        store._vector_store = MagicMock()
+        
+        evidences = [Evidence("Content 1", "Source 1"), Evidence("Content 2", "Source 2")]
+        for evidence in evidences:
+            store.add_evidence(evidence, [0.1, 0.2])
+        self.mock_g.reset_mock()
+        
+        results = store.search_similar_evidence([0.1, 0.2], top_k=2)
+        
+        self.assertEqual([evidence.content for evidence in results], ["Content 2", "Content 1"])
+        self.assertEqual(results[0].evidence_id, evidences[1].evidence_id)
+        self.mock_g.V.assert_not_called()
+    
+    def test_in_process_index_rewrites_in_place(self):
+        """Test that rewriting an ID replaces its indexed row instead of adding one."""
+        store = EvidenceStore(ann_backend="exact")
+        self.addCleanup(store.close)
+        store._vector_store = MagicMock()
+        
+        first = [1.0] + [0.0] * (evidence_module.VECTOR_DIMENSION - 1)
+        second = [0.0, 1.0] + [0.0] * (evidence_module.VECTOR_DIMENSION - 2)
+        store.add_evidence(Evidence("Old content", "Source", evidence_id="evidence-1"), first)
+        store.add_evidence_batch([Evidence("New content", "Source", evidence_id="evidence-1")], [second])
+        
+        self.assertEqual(len(store._ann_index), 1)
+        self.assertEqual(store._ann_ids, ["evidence-1"])
+        results = store.search_similar_evidence(second, top_k=5)
+        self.assertEqual([evidence.content for evidence in results], ["New content"])
+    
+    def test_in_process_index_copies_metadata(self):
+        """Test that neither the written evidence nor search results alias indexed metadata."""
+        store = EvidenceStore(ann_backend="exact")
+        self.addCleanup(store.close)
+        store._vector_store = MagicMock()
+        embedding = [1.0] + [0.0] * (evidence_module.VECTOR_DIMENSION - 1)
+        evidence = Evidence("Content", "Source", {"tags": ["a"]})
+        
+        store.add_evidence(evidence, embedding)
+        evidence.metadata["tags"].append("written")
+        store.search_similar_evidence(embedding, top_k=1)[0].metadata["tags"].append("searched")
+        
+        self.assertEqual(store.search_similar_evidence(embedding, top_k=1)[0].metadata, {"tags": ["a"]})
+    
+    def test_usearch_index_removes_rewritten_keys(self):
+        """Test that usearch drops a rewritten key's node before adding it again."""
+        store = EvidenceStore()
+        self.addCleanup(store.close)
+        store._ann_backend = "usearch"
+        store._ann_index = MagicMock()
+        evidence = Evidence("Old content", "Source", evidence_id="evidence-1")
+        
+        store._index_embeddings([evidence], [[0.1, 0.2]])
+        store._index_embeddings([Evidence("New content", "Source", evidence_id="evidence-1")], [[0.3, 0.4]])
+        
+        store._ann_index.remove.assert_called_once()
+        self.assertEqual(list(store._ann_index.remove.call_args.args[0]), [evidence.key])
+        self.assertEqual(store._ann_index.add.call_count, 2)
+        self.assertEqual(store._ann_rows, {evidence.key: 0})
+        self.assertEqual(store._ann_contents, ["New content"])
     
     def test_search_similar_evidence(self):
         """Test searching for similar evidence."""
@@ -157,10 +506,64 @@ class TestEvidenceStore(unittest.TestCase):
         self.assertEqual(results[1].evidence_id, 'evidence-2')
         self.assertEqual(results[1].content, 'Content 2')
     
+    def test_connection_is_lazy(self):
+        """Test that no connection is opened until Gremlin is used."""
+        self.mock_connection.assert_not_called()
+        self.evidence_store.g
+        self.mock_connection.assert_called_once()
+    
+    def test_connection_shared_between_stores(self):
+        """Test that stores share one connection and close it with the last user."""
+        other_store = EvidenceStore()
+        self.addCleanup(other_store.close)
+        connection = self.evidence_store.connection
+        self.assertIs(other_store.connection, connection)
+        self.mock_connection.assert_called_once()
+        
+        other_store.close()
+        connection.close.assert_not_called()
+        self.evidence_store.close()
+        connection.close.assert_called_once()
+    
+    def test_iam_handshakes_signed_when_made(self):
+        """Test that every WebSocket handshake of a shared IAM connection is signed afresh."""
+        self.mock_sign.side_effect = [{'Authorization': 'first'}, {'Authorization': 'second'}]
+        self.evidence_store.connection
+        transport_factory = self.mock_connection.call_args.kwargs['transport_factory']
+        self.mock_sign.assert_not_called()
+        
+        # The driver makes a new transport for each connection, including reconnects
+        first, second = transport_factory(), transport_factory()
+        first.connect('wss://test-endpoint.neptune.amazonaws.com:8182/gremlin', {'User-Agent': 'test'})
+        second.connect('wss://test-endpoint.neptune.amazonaws.com:8182/gremlin', {'User-Agent': 'test'})
+        
+        self.assertEqual(first.headers, {'User-Agent': 'test', 'Authorization': 'first'})
+        self.assertEqual(second.headers, {'User-Agent': 'test', 'Authorization': 'second'})
+    
+    def test_iam_handshake_sigv4_headers(self):
+        """Test the handshake headers produced by the real botocore signer."""
+        session = boto3.Session(
+            aws_access_key_id='AKIDEXAMPLE',
+            aws_secret_access_key='secret',
+            region_name='us-west-2'
+        )
+        self.evidence_store.connection
+        transport = self.mock_connection.call_args.kwargs['transport_factory']()
+        
+        with patch.object(evidence_module, 'get_signed_request_headers', neptune_config.get_signed_request_headers), \
+                patch.object(neptune_config, 'get_boto3_session', return_value=session):
+            transport.connect('wss://test-endpoint.neptune.amazonaws.com:8182/gremlin')
+        
+        authorization = transport.headers['Authorization']
+        self.assertTrue(authorization.startswith('AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/'))
+        self.assertIn('/us-west-2/neptune-db/aws4_request', authorization)
+        self.assertIn('X-Amz-Date', transport.headers)
+    
     def test_close(self):
         """Test closing the connection."""
+        connection = self.evidence_store.connection
         self.evidence_store.close()
-        self.evidence_store.connection.close.assert_called_once()
+        connection.close.assert_called_once()
 
 
 if __name__ == '__main__':
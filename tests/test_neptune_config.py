@@ -4,13 +4,14 @@ Unit tests for Neptune configuration.
 
 import unittest
 import os
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 import sys
-import importlib
 
 # Add the project root to the path so we can import the config module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from config.neptune_config import get_config, get_signed_request_headers
+
 
 class TestNeptuneConfig(unittest.TestCase):
     """Test cases for Neptune configuration."""
@@ -19,6 +20,9 @@ class TestNeptuneConfig(unittest.TestCase):
         """Set up test fixtures."""
         # Save original environment variables
         self.original_env = os.environ.copy()
+        
+        # Read the environment afresh in each test
+        get_config.cache_clear()
     
     def tearDown(self):
         """Tear down test fixtures."""
@@ -26,9 +30,8 @@ class TestNeptuneConfig(unittest.TestCase):
         os.environ.clear()
         os.environ.update(self.original_env)
         
-        # Reload the config module to reset any changes
-        if 'config.neptune_config' in sys.modules:
-            importlib.reload(sys.modules['config.neptune_config'])
+        # Drop the configuration cached from this test's environment
+        get_config.cache_clear()
     
     @patch.dict(os.environ, {
         'NEPTUNE_ENDPOINT': 'test-endpoint.neptune.amazonaws.com',
@@ -100,6 +103,40 @@ class TestNeptuneConfig(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_neptune_connection_string()
     
+    @patch.dict(os.environ, {
+        'NEPTUNE_ENDPOINT': 'test-endpoint.neptune.amazonaws.com',
+        'NEPTUNE_PORT': '8182'
+    })
+    def test_get_config_cached(self):
+        """Test that the configuration is read once until the cache is cleared."""
+        config = get_config()
+        self.assertEqual(config.endpoint, 'test-endpoint.neptune.amazonaws.com')
+        
+        os.environ['NEPTUNE_PORT'] = '9999'
+        self.assertIs(get_config(), config)
+        
+        get_config.cache_clear()
+        self.assertEqual(get_config().port, '9999')
+    
+    @patch.dict(os.environ, {
+        'NEPTUNE_ENDPOINT': 'test-endpoint.neptune.amazonaws.com',
+        'NEPTUNE_REGION': 'us-west-2'
+    })
+    @patch('config.neptune_config.get_boto3_session')
+    def test_signed_request_headers(self, mock_session):
+        """Test SigV4 headers for an IAM-authenticated connection."""
+        credentials = MagicMock()
+        credentials.get_frozen_credentials.return_value = MagicMock(
+            access_key='AKIDEXAMPLE', secret_key='secret', token=None
+        )
+        mock_session.return_value.get_credentials.return_value = credentials
+        
+        headers = get_signed_request_headers('wss://test-endpoint.neptune.amazonaws.com:8182/gremlin')
+        
+        mock_session.assert_called_once_with('us-west-2')
+        self.assertIn('AKIDEXAMPLE', headers['Authorization'])
+        self.assertIn('/us-west-2/neptune-db/', headers['Authorization'])
+    
     def test_constants_defined(self):
         """Test that all required constants are defined."""
         from config.neptune_config import (
@@ -13,6 +13,10 @@ from gremlin_python.process.traversal import T, P, Cardinality
 
 from config.neptune_config import get_neptune_connection_string, VECTOR_DIMENSION
 
+# Vertex and query vectors for the vector search test, generated once
+_RNG = np.random.default_rng(0)
+_VECTOR, _QUERY_VECTOR = _RNG.standard_normal((2, VECTOR_DIMENSION), dtype=np.float32)
+
 # Skip tests if Neptune endpoint is not configured
 skip_if_no_neptune = pytest.mark.skipif(
     os.getenv('NEPTUNE_ENDPOINT') is None,
@@ -67,22 +71,16 @@ class TestNeptuneConnection:
         # Generate a unique ID for the test vertex
         test_id = f"vector-test-{uuid.uuid4()}"
         
-        # Create a random vector
-        vector = np.random.rand(VECTOR_DIMENSION).tolist()
-        
         # Create a vertex with a vector property
         self.g.addV('VectorVertex').property(T.id, test_id) \
             .property('name', 'Vector Test') \
-            .property('embedding', vector) \
+            .property('embedding', _VECTOR.tolist()) \
             .next()
         
-        # Create a vector search query
-        query_vector = np.random.rand(VECTOR_DIMENSION).tolist()
-        
         try:
             # Attempt a vector search
             # Note: This assumes Neptune Analytics has vector search enabled
-            result = self.g.withSideEffect('vector', query_vector) \
+            result = self.g.withSideEffect('vector', _QUERY_VECTOR.tolist()) \
                 .V().hasLabel('VectorVertex') \
                 .order().by('embedding', 'vector') \
                 .limit(5) \
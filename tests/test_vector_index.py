@@ -0,0 +1,92 @@
+"""
+Unit tests for the exact vector index.
+"""
+
+import unittest
+import numpy as np
+from src.memory.vector_index import VectorIndex, quantize_int8, top_k_indices
+
+
+class TestVectorIndex(unittest.TestCase):
+    """Test cases for the VectorIndex class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rng = np.random.default_rng(0)
+        self.vectors = self.rng.standard_normal((200, 16)).astype(np.float32)
+        self.index = VectorIndex(16, initial_capacity=4)
+    
+    def test_add_grows_capacity(self):
+        """Test that adding past the initial capacity keeps every row."""
+        first = self.index.add(self.vectors[:3])
+        rest = self.index.add(self.vectors[3:])
+        
+        self.assertEqual(list(first), [0, 1, 2])
+        self.assertEqual(rest[0], 3)
+        self.assertEqual(len(self.index), 200)
+    
+    def test_search_matches_brute_force(self):
+        """Test that search returns the highest cosine similarities in order."""
+        self.index.add(self.vectors)
+        query = self.vectors[42] + 0.01
+        
+        rows, scores = self.index.search(query, 5)
+        
+        unit = self.vectors / np.linalg.norm(self.vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(unit @ (query / np.linalg.norm(query))))[:5]
+        self.assertEqual(list(rows), list(expected))
+        self.assertEqual(rows[0], 42)
+        self.assertTrue(np.all(np.diff(scores) <= 0))
+    
+    def test_quantize_int8(self):
+        """Test that int8 codes and scales reconstruct the input closely."""
+        codes, scales = quantize_int8(self.vectors)
+        
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual(scales.shape, (200,))
+        reconstructed = codes.astype(np.float32) * scales[:, None]
+        self.assertTrue(np.allclose(reconstructed, self.vectors, atol=np.max(scales)))
+    
+    def test_quantized_search_reranks_exactly(self):
+        """Test that quantized search returns exact scores for its matches."""
+        index = VectorIndex(16, quantize=True)
+        self.index.add(self.vectors)
+        index.add(self.vectors)
+        query = self.vectors[7] + 0.01
+        
+        rows, scores = index.search(query, 3)
+        exact_rows, exact_scores = self.index.search(query, 3)
+        
+        self.assertEqual(rows[0], 7)
+        self.assertEqual(list(rows), list(exact_rows))
+        self.assertTrue(np.allclose(scores, exact_scores))
+    
+    def test_top_k_indices(self):
+        """Test that partitioned top-k selection matches a full sort."""
+        scores = self.rng.standard_normal(1000).astype(np.float32)
+        
+        self.assertEqual(list(top_k_indices(scores, 5)), list(np.argsort(-scores)[:5]))
+        self.assertEqual(list(top_k_indices(scores[:3], 5)), list(np.argsort(-scores[:3])))
+    
+    def test_replace_overwrites_rows(self):
+        """Test that replaced rows are searched with their new vectors."""
+        index = VectorIndex(16, quantize=True)
+        index.add(self.vectors[:10])
+        
+        index.replace([3], self.vectors[[42]])
+        
+        rows, _ = index.search(self.vectors[42], 1)
+        self.assertEqual(len(index), 10)
+        self.assertEqual(rows[0], 3)
+        with self.assertRaises(IndexError):
+            index.replace([10], self.vectors[[0]])
+    
+    def test_search_empty_index(self):
+        """Test searching an empty index."""
+        rows, scores = self.index.search(self.vectors[0], 5)
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(len(scores), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()